@@ -0,0 +1,72 @@
+# Пропускная способность асинхронных контроллеров при разной конкурентности
+# Запуск: python -m benchmarks.bench_async [количество задач] [количество запросов]
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+
+from benchmarks.common import temp_database, timer
+from controllers.async_controller import AsyncTaskController, DatabaseExecutor
+from models.task import Task
+
+READERS = 4
+
+
+async def run_reads(tasks, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await tasks.get_tasks_by_project(i % 50)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+
+
+async def run_mixed(tasks, requests, concurrency):
+    # Каждый десятый запрос пишет, остальные читают
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            if i % 10 == 0:
+                await tasks.update_task(i + 1, priority=i % 5)
+            else:
+                await tasks.count_tasks(project_id=i % 50)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+
+
+async def run_stream(tasks):
+    count = 0
+    async for _ in tasks.iter_tasks():
+        count += 1
+    return count
+
+
+async def run_all(db, task_count, requests):
+    # Один цикл событий на весь прогон: семафоры исполнителя привязаны к нему
+    executor = DatabaseExecutor(db, readers=READERS)
+    tasks = AsyncTaskController(executor)
+    for concurrency in (1, 4, 16, 64):
+        with timer(f"reads x{requests}, concurrency {concurrency}", requests, "req"):
+            await run_reads(tasks, requests, concurrency)
+        with timer(f"mixed x{requests}, concurrency {concurrency}", requests, "req"):
+            await run_mixed(tasks, requests, concurrency)
+    with timer("iter_tasks stream", task_count):
+        await run_stream(tasks)
+    executor.shutdown()
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    due_date = datetime.now() + timedelta(days=7)
+
+    with temp_database(pool_size=READERS + 1, profile="balanced") as db:
+        db.add_tasks_bulk(Task(f"Task {i}", "Benchmark task", 1, due_date, i % 50, i % 20)
+                          for i in range(task_count))
+        asyncio.run(run_all(db, task_count, requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Сравнение построчной вставки задач с add_tasks_bulk
+# Запуск: python -m benchmarks.bench_bulk_insert [количество задач]
+
+import sys
+from datetime import datetime, timedelta
+
+from benchmarks.common import temp_database, timer
+from models.task import Task
+
+
+def make_tasks(count):
+    due_date = datetime.now() + timedelta(days=7)
+    return [Task(f"Task {i}", "Benchmark task", i % 3 + 1, due_date, 1, 1) for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    tasks = make_tasks(count)
+
+    with temp_database() as db:
+        with timer("add_task (one commit per row)", count):
+            for task in tasks:
+                db.add_task(task)
+
+    with temp_database() as db:
+        with timer("add_tasks_bulk (one transaction)", count):
+            db.add_tasks_bulk(tasks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Скорость загрузки задач: прежний декодер на sqlite3.Row против текущего
+# Запуск: python -m benchmarks.bench_decoding [количество задач]
+
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import temp_database
+from models.task import Task
+
+REPEATS = 3
+
+
+def legacy_row_to_task(row):
+    # Decoder as it was before the positional fast path
+    due_date = datetime.fromisoformat(row['due_date']) if row['due_date'] else None
+    task = Task(row['title'], row['description'], row['priority'], due_date,
+                row['project_id'], row['assignee_id'])
+    task.id = row['id']
+    task.status = row['status']
+    return task
+
+
+def legacy_get_all_tasks(conn):
+    return [legacy_row_to_task(row) for row in conn.execute('SELECT * FROM tasks').fetchall()]
+
+
+def best_of(function):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(label, legacy, current):
+    print(f"{label:<28} legacy {legacy:7.3f} s   current {current:7.3f} s   "
+          f"speedup {legacy / current:4.1f}x")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    base = datetime(2030, 1, 1)
+    with temp_database() as db:
+        db.add_tasks_bulk(Task(f"Task {i}", "Benchmark task", i % 3 + 1,
+                               base + timedelta(minutes=i), 1, 1)
+                          for i in range(count))
+        legacy_conn = sqlite3.connect(db.db_path)
+        legacy_conn.row_factory = sqlite3.Row
+        named_rows = legacy_conn.execute('SELECT * FROM tasks').fetchall()
+        rows = db._fetch_all('SELECT * FROM tasks')
+
+        print(f"{count} tasks")
+        report("hydration only", best_of(lambda: [legacy_row_to_task(r) for r in named_rows]),
+               best_of(lambda: list(map(db._row_to_task, rows))))
+        report("full scan (get_all_tasks)", best_of(lambda: legacy_get_all_tasks(legacy_conn)),
+               best_of(db.get_all_tasks))
+        # Building the row tuples in sqlite3 is paid by both paths and bounds the scan speedup
+        fetch = best_of(lambda: db._fetch_all('SELECT * FROM tasks'))
+        print(f"{'sqlite3 fetch only':<28} {fetch:7.3f} s")
+        legacy_conn.close()
+
+
+if __name__ == "__main__":
+    main()
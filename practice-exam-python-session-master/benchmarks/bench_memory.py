@@ -0,0 +1,44 @@
+# Память на задачу: объекты с __dict__, объекты со __slots__ и TaskBatch
+# Запуск: python -m benchmarks.bench_memory [количество задач]
+
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from benchmarks.common import temp_database
+from models.task import Task
+
+
+class DictTask:
+    # Same fields as Task before it switched to __slots__
+    def __init__(self, row):
+        (self.id, self.title, self.description, self.priority, self.status,
+         due_date, self.project_id, self.assignee_id) = row
+        self.due_date = datetime.fromisoformat(due_date) if due_date else None
+
+
+def measure(label, load, count):
+    tracemalloc.start()
+    result = load()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} retained {current / count:8.1f} B/task   peak {peak / 2 ** 20:8.1f} MiB")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    base = datetime(2030, 1, 1)
+    with temp_database() as db:
+        db.add_tasks_bulk(Task(f"Task {i}", "Benchmark task", i % 3 + 1,
+                               base + timedelta(minutes=i), i % 50, i % 20)
+                          for i in range(count))
+        print(f"{count} tasks")
+        measure("list of dict-based tasks",
+                lambda: [DictTask(row) for row in db._fetch_all("SELECT * FROM tasks")], count)
+        measure("list of slotted Task", db.get_all_tasks, count)
+        measure("TaskBatch", db.get_task_batch, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Пропускная способность чтения в режиме пула соединений
+# Запуск: python -m benchmarks.bench_pool_reads [количество задач] [количество запросов]
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from benchmarks.common import temp_database, timer
+from database.database_manager import DatabaseManager
+from models.task import Task
+
+
+def main():
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    due_date = datetime.now() + timedelta(days=7)
+
+    with temp_database() as db:
+        db.add_tasks_bulk(Task(f"Task {i}", "Benchmark task", 1, due_date, i % 50, i % 20)
+                          for i in range(task_count))
+        for threads in (1, 2, 4, 8):
+            pooled = DatabaseManager(db.db_path, pool_size=threads)
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                with timer(f"get_tasks_by_project x{requests}, {threads} threads", requests, "req"):
+                    project_ids = (i % 50 for i in range(requests))
+                    list(executor.map(pooled.get_tasks_by_project, project_ids))
+            pooled.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# Пропускная способность смешанной нагрузки для профилей PRAGMA
+# Запуск: python -m benchmarks.bench_profiles [количество операций]
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from benchmarks.common import temp_database, timer
+from database.profiles import PROFILES
+from models.task import Task
+
+THREADS = 4
+
+
+def run_mixed(db, operations):
+    due_date = datetime.now() + timedelta(days=7)
+
+    def operation(i):
+        # One write for every four reads
+        if i % 5 == 0:
+            db.add_task(Task(f"Task {i}", "Benchmark task", 1, due_date, i % 10, i % 7))
+        else:
+            db.get_tasks_by_project(i % 10)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(operation, range(operations)))
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for profile in (None, *PROFILES):
+        with temp_database(pool_size=THREADS, profile=profile) as db:
+            db.add_tasks_bulk(Task(f"Seed {i}", "Seed task", 1, None, i % 10, i % 7)
+                              for i in range(1000))
+            with timer(f"mixed 80/20, profile={profile or 'default'}", operations, "ops"):
+                run_mixed(db, operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Задержка поиска задач: FTS5 с ранжированием против LIKE
+# Запуск: python -m benchmarks.bench_search [размеры через запятую]
+
+import random
+import sys
+import time
+
+from benchmarks.common import temp_database
+from models.task import Task
+
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "ta", "vo", "si", "de", "pa", "zu", "ge")
+REPEATS = 5
+
+
+def make_vocabulary(rng, size=5000):
+    return ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(size)]
+
+
+def make_queries(vocabulary):
+    word, other = vocabulary[10], vocabulary[20]
+    return (word, word[:3], f'"{word} {other}"', f"{word} {other}")
+
+
+def make_tasks(count, rng, vocabulary):
+    for i in range(count):
+        title = " ".join(rng.choices(vocabulary, k=4))
+        description = " ".join(rng.choices(vocabulary, k=30))
+        yield Task(f"{title} {i}", description, 1, None, None, None)
+
+
+def measure(search, query):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        search(query, limit=50)
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def like_search(db):
+    def search(query, limit):
+        return db._fetch_models(db._row_to_task, *db._like_search_query(query, limit))
+    return search
+
+
+def main():
+    sizes = [10_000, 100_000, 1_000_000]
+    if len(sys.argv) > 1:
+        sizes = [int(s) for s in sys.argv[1].split(",")]
+    for size in sizes:
+        with temp_database(profile="bulk-load") as db:
+            rng = random.Random(42)
+            vocabulary = make_vocabulary(rng)
+            db.add_tasks_bulk(make_tasks(size, rng, vocabulary))
+            for query in make_queries(vocabulary):
+                fts_ms = measure(db.search_tasks, query)
+                like_ms = measure(like_search(db), query)
+                print(f"{size:>9} tasks  {query:<18} fts {fts_ms:9.2f} ms   like {like_ms:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Частые мелкие записи: коммит на каждый update_task против группового коммита
+# Запуск: python -m benchmarks.bench_write_behind [количество записей] [потоков]
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import percentile, temp_database
+from database.database_manager import DatabaseManager
+from database.write_behind import WriteBehindQueue
+from models.task import Task
+
+
+def run(label, write, count, threads):
+    def timed(i):
+        start = time.perf_counter()
+        write(i)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = list(executor.map(timed, range(count)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {count / elapsed:10.0f} writes/s   "
+          f"p50 {percentile(latencies, 0.5) * 1000:7.2f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:7.2f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    with temp_database() as db:
+        task_ids = db.add_tasks_bulk(Task(f"Task {i}", "Benchmark task", 1, None, None, None)
+                                     for i in range(count))
+        pooled = DatabaseManager(db.db_path, pool_size=threads + 1, profile="durable")
+
+        def direct(i):
+            pooled.update_task(task_ids[i], status="in_progress")
+
+        run("update_task, commit each", direct, count, threads)
+
+        with WriteBehindQueue(pooled) as writer:
+            def grouped(i):
+                writer.update_task(task_ids[i], status="completed").result()
+
+            run("write-behind, group commit", grouped, count, threads)
+            print(f"{'':<28} {writer.operations} writes in {writer.batches} commits")
+        pooled.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from database.database_manager import DatabaseManager
+
+
+@contextmanager
+def temp_database(**kwargs):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db = DatabaseManager(path, **kwargs)
+    db.create_tables()
+    try:
+        yield db
+    finally:
+        db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+
+@contextmanager
+def timer(label, count=None, unit="rows"):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    if count:
+        print(f"{label:<40} {elapsed:8.3f} s  {count / elapsed:12.0f} {unit}/s")
+    else:
+        print(f"{label:<40} {elapsed:8.3f} s")
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
@@ -0,0 +1,106 @@
+# Воспроизводимые синтетические наборы данных для бенчмарков
+# Один и тот же seed всегда дает одинаковых пользователей, проекты и задачи
+
+import random
+from datetime import datetime, timedelta
+
+from models.project import Project
+from models.task import Task
+from models.user import User
+
+DEFAULT_SEED = 42
+# Фиксированная "текущая" дата: просроченность не зависит от дня запуска
+BASE_DATE = datetime(2025, 1, 1)
+ROLES = ("developer", "manager", "admin")
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "ta", "vo", "si", "de", "pa", "zu", "ge")
+VOCABULARY_SIZE = 5000
+# Распределения по умолчанию
+DUE_SPREAD_DAYS = 180
+STATUS_MIX = (5, 3, 2)
+DESCRIPTION_WORDS = 30
+UNASSIGNED_SHARE = 0.2
+
+
+def dataset_shape(task_count) -> tuple[int, int]:
+    # Users and projects grow with the number of tasks
+    return max(10, task_count // 50), max(5, task_count // 200)
+
+
+def make_vocabulary(rng, size=VOCABULARY_SIZE) -> list[str]:
+    return ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(size)]
+
+
+def make_users(rng, count):
+    for i in range(count):
+        user = User(f"user{i:07d}", f"user{i:07d}@example.com", rng.choice(ROLES))
+        user.registration_date = BASE_DATE - timedelta(days=rng.randint(0, 1000))
+        yield user
+
+
+def make_projects(rng, count, vocabulary):
+    for i in range(count):
+        start = BASE_DATE - timedelta(days=rng.randint(0, 365))
+        name = " ".join(rng.choices(vocabulary, k=2))
+        yield Project(f"{name} {i}", " ".join(rng.choices(vocabulary, k=12)), start,
+                      start + timedelta(days=rng.randint(30, 400)))
+
+
+def skewed_weights(count, skew) -> list[float]:
+    # Zipf-like cumulative weights: skew 0 is uniform, larger values concentrate
+    # the picks on the first items
+    cumulative, total = [], 0.0
+    for rank in range(1, count + 1):
+        total += 1 / rank ** skew
+        cumulative.append(total)
+    return cumulative
+
+
+def make_tasks(rng, count, project_ids, user_ids, vocabulary, assignee_skew=0.0,
+               due_spread_days=DUE_SPREAD_DAYS, status_mix=STATUS_MIX,
+               description_words=DESCRIPTION_WORDS, unassigned=UNASSIGNED_SHARE):
+    assignee_weights = skewed_weights(len(user_ids), assignee_skew)
+    for i in range(count):
+        due_date = None
+        if rng.random() < 0.9:
+            due_date = BASE_DATE + timedelta(days=rng.randint(-due_spread_days, due_spread_days))
+        assignee_id = None
+        if rng.random() >= unassigned:
+            assignee_id = rng.choices(user_ids, cum_weights=assignee_weights)[0]
+        task = Task(f"{' '.join(rng.choices(vocabulary, k=4))} {i}",
+                    " ".join(rng.choices(vocabulary, k=description_words)),
+                    rng.randint(1, 5), due_date, rng.choice(project_ids), assignee_id)
+        task.status = rng.choices(Task.STATUSES, weights=status_mix)[0]
+        yield task
+
+
+def build_dataset(db, task_count, seed=DEFAULT_SEED, users=None, projects=None,
+                  **task_options) -> dict:
+    # task_options go to make_tasks: assignee_skew, due_spread_days, status_mix, ...
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    user_count, project_count = dataset_shape(task_count)
+    user_ids = db.add_users_bulk(make_users(rng, users or user_count))
+    project_ids = db.add_projects_bulk(make_projects(rng, projects or project_count, vocabulary))
+    task_ids = db.add_tasks_bulk(make_tasks(rng, task_count, project_ids, user_ids, vocabulary,
+                                            **task_options))
+    return {
+        "seed": seed,
+        "vocabulary": vocabulary,
+        "user_ids": user_ids,
+        "project_ids": project_ids,
+        "task_ids": task_ids,
+    }
+
+
+def load_dataset(db, seed=DEFAULT_SEED) -> dict:
+    # Same shape as build_dataset() for a database that is already populated;
+    # search words are taken from existing task titles
+    titles = [task.title for task in db.get_tasks_page(limit=1000).items]
+    vocabulary = sorted({word for title in titles for word in title.split() if not word.isdigit()})
+    return {
+        "seed": seed,
+        "vocabulary": vocabulary or ["task"],
+        "user_ids": [row.id for row in db.get_users(fields=("id",))],
+        "project_ids": [row.id for row in db.get_projects(fields=("id",))],
+        "task_ids": [row.id for row in db.get_tasks(fields=("id",))],
+    }
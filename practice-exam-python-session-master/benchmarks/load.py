@@ -0,0 +1,134 @@
+# Генератор нагрузки: смесь чтений и записей через контроллеры из N потоков или процессов
+# Запуск: python manage.py load --threads 4 --duration 10 --mix get_task=60,update_task_status=10
+
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.common import percentile
+from benchmarks.datasets import BASE_DATE, load_dataset
+from benchmarks.suite import OPERATIONS, Context
+from database.database_manager import DatabaseManager
+
+DEFAULT_MIX = {
+    "get_task": 40,
+    "get_tasks_by_user": 15,
+    "get_tasks_by_project": 10,
+    "search_tasks": 10,
+    "get_overdue_tasks": 5,
+    "get_project_progress": 5,
+    "update_task_status": 10,
+    "add_task": 5,
+}
+
+
+def _add_task(ctx):
+    return ctx.tasks.add_task("Load task", "Created by the load generator", ctx.rng.randint(1, 5),
+                              BASE_DATE, ctx.pick("project_ids"), ctx.pick("user_ids"))
+
+
+LOAD_OPERATIONS = {**OPERATIONS, "add_task": _add_task}
+
+
+def parse_mix(text) -> dict:
+    # "get_task=60,update_task_status=10" -> {"get_task": 60, ...}
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        if name not in LOAD_OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}. Must be one of {list(LOAD_OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def _worker(db_path, profile, dataset, mix, seed, ops, duration) -> tuple[dict, dict]:
+    # Every worker has its own connection, as a separate client would
+    db = DatabaseManager(db_path, profile=profile)
+    ctx = Context(db, {**dataset, "seed": seed})
+    names, weights = list(mix), list(mix.values())
+    latencies, errors = defaultdict(list), defaultdict(int)
+    deadline = time.perf_counter() + duration if duration else None
+    done = 0
+    try:
+        while (ops is None or done < ops) and (deadline is None or time.perf_counter() < deadline):
+            name = ctx.rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                LOAD_OPERATIONS[name](ctx)
+            except Exception:
+                errors[name] += 1
+            latencies[name].append(time.perf_counter() - start)
+            done += 1
+    finally:
+        db.close()
+    return dict(latencies), dict(errors)
+
+
+def _load_populated_dataset(db_path) -> dict:
+    setup = DatabaseManager(db_path)
+    try:
+        dataset = load_dataset(setup)
+    finally:
+        setup.close()
+    if not dataset["task_ids"] or not dataset["project_ids"] or not dataset["user_ids"]:
+        raise ValueError("Load run needs a populated database, run generate first")
+    return dataset
+
+
+def _merge_outcomes(outcomes) -> tuple[dict, dict]:
+    latencies, errors = defaultdict(list), defaultdict(int)
+    for worker_latencies, worker_errors in outcomes:
+        for name, samples in worker_latencies.items():
+            latencies[name] += samples
+        for name, count in worker_errors.items():
+            errors[name] += count
+    return latencies, errors
+
+
+def run_load(db_path, workers=4, mix=None, ops=None, duration=None, processes=False,
+             profile="balanced", seed=0) -> dict:
+    if ops is None and duration is None:
+        raise ValueError("Load run needs ops or duration")
+    mix = mix or DEFAULT_MIX
+    dataset = _load_populated_dataset(db_path)
+
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    with executor_class(max_workers=workers) as executor:
+        futures = [executor.submit(_worker, db_path, profile, dataset, mix, rng.random(),
+                                   ops, duration)
+                   for _ in range(workers)]
+        outcomes = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    latencies, errors = _merge_outcomes(outcomes)
+    total = sum(len(samples) for samples in latencies.values())
+    return {
+        "workers": workers,
+        "mode": "processes" if processes else "threads",
+        "elapsed": elapsed,
+        "ops": total,
+        "ops_per_sec": total / elapsed,
+        "operations": {
+            name: {
+                "calls": len(samples),
+                "errors": errors.get(name, 0),
+                "p50_ms": percentile(samples, 0.5) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+            }
+            for name, samples in sorted(latencies.items())
+        },
+    }
+
+
+def format_report(report) -> str:
+    lines = [f"{report['ops']} ops in {report['elapsed']:.2f} s from {report['workers']} "
+             f"{report['mode']}: {report['ops_per_sec']:.0f} ops/s"]
+    for name, stats in report["operations"].items():
+        lines.append(f"  {name:<26} {stats['calls']:>8} calls  {stats['errors']:>5} errors  "
+                     f"p50 {stats['p50_ms']:8.3f} ms  p95 {stats['p95_ms']:8.3f} ms  "
+                     f"p99 {stats['p99_ms']:8.3f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,204 @@
+# Набор бенчмарков по всем основным операциям DatabaseManager и контроллеров
+# Запуск:
+#   python -m benchmarks.suite run [--sizes 1000,100000,1000000] [--output results.json]
+#   python -m benchmarks.suite compare baseline.json results.json [--threshold 0.2]
+
+import argparse
+import json
+import platform
+import random
+import sqlite3
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.common import percentile, temp_database
+from benchmarks.datasets import BASE_DATE, DEFAULT_SEED, build_dataset
+from controllers.project_controller import ProjectController
+from controllers.task_controller import TaskController
+from controllers.user_controller import UserController
+from models.task import Task
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+# Каждая операция повторяется, пока не наберется MIN_CALLS вызовов и
+# TIME_BUDGET секунд, но не больше MAX_CALLS
+MIN_CALLS = 3
+MAX_CALLS = 500
+TIME_BUDGET = 1.0
+DEFAULT_THRESHOLD = 0.2
+# Абсолютные изменения меньше этих значений считаются шумом
+NOISE_FLOOR = {"p50_ms": 0.05, "peak_kib": 64.0}
+
+
+class Context:
+    def __init__(self, db, dataset) -> None:
+        self.db = db
+        self.dataset = dataset
+        self.tasks = TaskController(db)
+        self.projects = ProjectController(db)
+        self.users = UserController(db)
+        self.rng = random.Random(dataset["seed"])
+
+    def pick(self, key):
+        return self.rng.choice(self.dataset[key])
+
+
+def _search(ctx):
+    return ctx.tasks.search_tasks(ctx.rng.choice(ctx.dataset["vocabulary"]), limit=50)
+
+
+def _update_status(ctx):
+    return ctx.tasks.update_task_status(ctx.pick("task_ids"), ctx.rng.choice(Task.STATUSES))
+
+
+def _task_query(ctx):
+    query = (ctx.tasks.query().status("pending", "in_progress").priority_between(2, 4)
+             .assigned_to(ctx.pick("user_ids")).order_by("due_date").limit(50))
+    return query.all()
+
+
+# Название операции -> функция одного вызова
+OPERATIONS = {
+    "get_all_tasks": lambda ctx: ctx.tasks.get_all_tasks(),
+    "get_task": lambda ctx: ctx.tasks.get_task(ctx.pick("task_ids")),
+    "get_tasks_by_ids":
+        lambda ctx: ctx.tasks.get_tasks_by_ids(ctx.rng.sample(ctx.dataset["task_ids"], 100)),
+    "get_tasks_by_project": lambda ctx: ctx.tasks.get_tasks_by_project(ctx.pick("project_ids")),
+    "get_tasks_by_user": lambda ctx: ctx.tasks.get_tasks_by_user(ctx.pick("user_ids")),
+    "get_tasks_projection": lambda ctx: ctx.tasks.get_tasks(fields=("id", "title", "status")),
+    "get_tasks_page": lambda ctx: ctx.tasks.get_tasks_page(limit=50, order_by="due_date"),
+    "get_tasks_with_details":
+        lambda ctx: ctx.tasks.get_tasks_with_details(project_id=ctx.pick("project_ids")),
+    "search_tasks": _search,
+    "task_query": _task_query,
+    "get_overdue_tasks": lambda ctx: ctx.tasks.get_overdue_tasks(BASE_DATE, limit=100),
+    "overdue_count": lambda ctx: ctx.tasks.overdue_count(BASE_DATE),
+    "count_tasks_by_status": lambda ctx: ctx.tasks.count_tasks_by("status"),
+    "get_task_batch": lambda ctx: ctx.tasks.get_task_batch(),
+    "update_task_status": _update_status,
+    "get_project_progress": lambda ctx: ctx.projects.get_project_progress(ctx.pick("project_ids")),
+    "get_all_project_progress": lambda ctx: ctx.projects.get_all_project_progress(),
+    "get_status_counts": lambda ctx: ctx.projects.get_status_counts(),
+    "get_all_projects": lambda ctx: ctx.projects.get_all_projects(),
+    "get_user": lambda ctx: ctx.users.get_user(ctx.pick("user_ids")),
+    "get_all_users": lambda ctx: ctx.users.get_all_users(),
+}
+
+
+def measure(ctx, operation) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < MAX_CALLS and (
+            len(latencies) < MIN_CALLS or time.perf_counter() - started < TIME_BUDGET):
+        start = time.perf_counter()
+        operation(ctx)
+        latencies.append(time.perf_counter() - start)
+    # Отдельный вызов под tracemalloc: трассировка замедляет выполнение
+    tracemalloc.start()
+    operation(ctx)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "calls": len(latencies),
+        "ops_per_sec": len(latencies) / sum(latencies),
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def run(sizes, operations, seed) -> dict:
+    results = []
+    for size in sizes:
+        with temp_database(profile="balanced") as db:
+            start = time.perf_counter()
+            ctx = Context(db, build_dataset(db, size, seed))
+            print(f"{size} tasks, dataset built in {time.perf_counter() - start:.1f} s",
+                  file=sys.stderr)
+            for name in operations:
+                result = {"size": size, "operation": name, **measure(ctx, OPERATIONS[name])}
+                results.append(result)
+                print(f"{size:>9} {name:<26} {result['ops_per_sec']:10.1f} ops/s  "
+                      f"p50 {result['p50_ms']:9.3f} ms  p99 {result['p99_ms']:9.3f} ms  "
+                      f"peak {result['peak_kib']:10.1f} KiB", file=sys.stderr)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "seed": seed,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold) -> list[str]:
+    # Регрессия: p50 или пиковая память выросли больше чем на threshold
+    previous = {(r["size"], r["operation"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["size"], result["operation"]))
+        if before is None:
+            continue
+        for metric, floor in NOISE_FLOOR.items():
+            change = result[metric] / before[metric] - 1 if before[metric] else 0.0
+            regressed = change > threshold and result[metric] - before[metric] > floor
+            flag = "REGRESSION" if regressed else ""
+            print(f"{result['size']:>9} {result['operation']:<26} {metric:<9} "
+                  f"{before[metric]:10.3f} -> {result[metric]:10.3f}  {change:+7.1%} {flag}")
+            if flag:
+                regressions.append(
+                    f"{result['operation']} [{result['size']}] {metric} {change:+.1%}")
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Database and controller benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and write JSON results")
+    run_parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                            help="comma separated task counts")
+    run_parser.add_argument("--operations", default=",".join(OPERATIONS),
+                            help="comma separated operation names")
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run_parser.add_argument("--output", help="JSON file for results (default: stdout)")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="allowed relative slowdown, 0.2 means 20%%")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "run":
+        operations = args.operations.split(",")
+        unknown = [name for name in operations if name not in OPERATIONS]
+        if unknown:
+            raise SystemExit(f"Unknown operations: {unknown}. Available: {list(OPERATIONS)}")
+        report = run([int(s) for s in args.sizes.split(",")], operations, args.seed)
+        text = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for line in regressions:
+        print(f"regression: {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from controllers.task_controller import TaskController
+from controllers.project_controller import ProjectController
+from controllers.user_controller import UserController
+from database.database_manager import STREAM_CHUNK_SIZE
+
+# Controller methods with these prefixes change data and go to the writer
+WRITE_PREFIXES = ("add_", "update_", "delete_", "bulk_", "reassign_", "rebuild_")
+
+
+def _next_chunk(iterator, size) -> list:
+    return list(islice(iterator, size))
+
+
+def _uses_wal(profile) -> bool:
+    return profile is not None and dict(profile["pragmas"]).get("journal_mode") == "WAL"
+
+
+class DatabaseExecutor:
+    # One writer thread keeps writes serialized; readers run in parallel on
+    # their own pooled connections (WAL lets them read during a write)
+    def __init__(self, db_manager, readers=4, max_pending=256) -> None:
+        if db_manager.pool is None:
+            raise ValueError("Async controllers need a pooled DatabaseManager (pool_size)")
+        # In rollback-journal mode an open stream's SHARED lock blocks every
+        # write until the busy timeout runs out
+        if not _uses_wal(db_manager.profile):
+            raise ValueError("Async controllers need a WAL profile (profile=...)")
+        pool_size = db_manager.pool.size
+        if pool_size < readers + 1:
+            raise ValueError(f"Pool of {pool_size} is too small for {readers} readers and a writer")
+        self.db = db_manager
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self.readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="db-reader")
+        # Callers wait here once max_pending calls are queued or running
+        self._slots = asyncio.Semaphore(max_pending)
+        # An open stream keeps its pooled connection; capping streams at the
+        # reader count always leaves a connection for the writer
+        self._streams = asyncio.Semaphore(readers)
+
+    async def run(self, executor, func, *args, **kwargs):
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    async def write(self, func, *args, **kwargs):
+        return await self.run(self.writer, func, *args, **kwargs)
+
+    async def read(self, func, *args, **kwargs):
+        return await self.run(self.readers, func, *args, **kwargs)
+
+    async def stream(self, func, *args, **kwargs):
+        # The blocking generator is advanced a chunk at a time on a reader
+        async with self._streams:
+            rows = await self.read(func, *args, **kwargs)
+            try:
+                while True:
+                    chunk = await self.read(_next_chunk, rows, STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        return
+                    for row in chunk:
+                        yield row
+            finally:
+                await self.read(rows.close)
+
+    def shutdown(self, wait=True) -> None:
+        self.writer.shutdown(wait=wait)
+        self.readers.shutdown(wait=wait)
+
+
+class _AsyncController:
+    controller_class = None
+
+    def __init__(self, executor) -> None:
+        self.executor = executor
+        self.controller = self.controller_class(executor.db)
+
+    def __getattr__(self, name):
+        method = getattr(self.controller, name)
+        if not callable(method) or name.startswith("_"):
+            return method
+        if name.startswith("iter_"):
+            return partial(self.executor.stream, method)
+        if name.startswith(WRITE_PREFIXES):
+            return partial(self.executor.write, method)
+        return partial(self.executor.read, method)
+
+
+class AsyncTaskController(_AsyncController):
+    controller_class = TaskController
+
+    async def run_query(self, query) -> list:
+        return await self.executor.read(query.all)
+
+
+class AsyncProjectController(_AsyncController):
+    controller_class = ProjectController
+
+
+class AsyncUserController(_AsyncController):
+    controller_class = UserController
@@ -0,0 +1,220 @@
+# Metrics for controller calls in the Prometheus text exposition format.
+# instrument_controller() wraps the public methods of a controller so every
+# call updates per-method call/error counters and a latency histogram.
+# Percentiles are computed over the most recent RESERVOIR_SIZE calls. The
+# registry can be served over HTTP (serve_metrics) or dumped to a file
+# periodically (MetricsFileWriter).
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+QUANTILES = (0.5, 0.95, 0.99)
+RESERVOIR_SIZE = 1024
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _bound(value) -> str:
+    return "+Inf" if value == float("inf") else f"{value:g}"
+
+
+def percentile(ordered, fraction) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class MethodMetrics:
+    __slots__ = ("calls", "errors", "total", "buckets", "recent")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.recent = deque(maxlen=RESERVOIR_SIZE)
+
+    def add(self, elapsed, error) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total += elapsed
+        self.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.recent.append(elapsed)
+
+    def quantiles(self) -> dict:
+        ordered = sorted(self.recent)
+        return {q: percentile(ordered, q) for q in QUANTILES}
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._methods = {}
+        self._gauges = []
+        self._lock = threading.Lock()
+
+    def record(self, controller, method, elapsed, error=False) -> None:
+        with self._lock:
+            metrics = self._methods.get((controller, method))
+            if metrics is None:
+                metrics = self._methods[(controller, method)] = MethodMetrics()
+            metrics.add(elapsed, error)
+
+    def add_gauge(self, name, help_text, callback, label=None) -> None:
+        # callback returns a number, or {label value: number} when label is set
+        self._gauges.append((name, help_text, callback, label))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                key: {"calls": m.calls, "errors": m.errors, "total": m.total, **{
+                    f"p{round(q * 100)}": value for q, value in m.quantiles().items()
+                }}
+                for key, m in self._methods.items()
+            }
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            methods = sorted(self._methods.items())
+            self._render_counters(lines, methods)
+            self._render_latency(lines, methods)
+        for name, help_text, callback, label in self._gauges:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            values = callback()
+            if label is None:
+                lines.append(f"{name} {values}")
+            else:
+                lines += [f"{name}{_labels(**{label: key})} {value}"
+                          for key, value in values.items()]
+        return "\n".join(lines) + "\n"
+
+    def _render_counters(self, lines, methods) -> None:
+        counters = (("controller_calls_total", "calls", "Controller method calls"),
+                    ("controller_errors_total", "errors", "Controller calls that raised"))
+        for name, attr, help_text in counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (controller, method), metrics in methods:
+                labels = _labels(controller=controller, method=method)
+                lines.append(f"{name}{labels} {getattr(metrics, attr)}")
+
+    def _render_latency(self, lines, methods) -> None:
+        name = "controller_call_duration_seconds"
+        lines += [f"# HELP {name} Controller call latency", f"# TYPE {name} histogram"]
+        for (controller, method), metrics in methods:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                cumulative += count
+                labels = _labels(controller=controller, method=method, le=_bound(bound))
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _labels(controller=controller, method=method)
+            lines += [f"{name}_sum{labels} {metrics.total}",
+                      f"{name}_count{labels} {metrics.calls}"]
+        name = "controller_call_duration_quantile_seconds"
+        lines += [f"# HELP {name} Latency percentiles over the last {RESERVOIR_SIZE} calls",
+                  f"# TYPE {name} gauge"]
+        for (controller, method), metrics in methods:
+            for q, value in metrics.quantiles().items():
+                labels = _labels(controller=controller, method=method, quantile=q)
+                lines.append(f"{name}{labels} {value}")
+
+
+def _timed(registry, controller_name, name, method):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception:
+            registry.record(controller_name, name, time.perf_counter() - start, error=True)
+            raise
+        registry.record(controller_name, name, time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+def instrument_controller(controller, registry):
+    controller_name = type(controller).__name__
+    for name in dir(type(controller)):
+        method = getattr(controller, name)
+        if not name.startswith("_") and callable(method):
+            setattr(controller, name, _timed(registry, controller_name, name, method))
+    return controller
+
+
+def register_database_gauges(registry, db_manager) -> None:
+    # Gauges are read from the HTTP or file-writer thread
+    if db_manager.pool is None:
+        raise ValueError("Database gauges need a pooled DatabaseManager (pool_size)")
+    registry.add_gauge("database_rows", "Rows per table", lambda: {
+        "tasks": db_manager.count_tasks(),
+        "projects": db_manager.count_projects(),
+        "users": db_manager.count_users(),
+    }, label="table")
+
+    def cache_entries():
+        if db_manager.cache is None:
+            return {}
+        return {kind: stats["size"] for kind, stats in db_manager.cache.stats().items()}
+
+    registry.add_gauge("database_cache_entries", "Entities held in the identity-map cache",
+                       cache_entries, label="kind")
+
+
+def serve_metrics(registry, port=9464, host="127.0.0.1") -> ThreadingHTTPServer:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+class MetricsFileWriter:
+    def __init__(self, registry, path, interval=15.0) -> None:
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-file", daemon=True)
+        self._thread.start()
+
+    def write(self) -> None:
+        # Written aside and renamed so a scraper never reads a partial file
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.registry.render())
+        os.replace(temp_path, self.path)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.write()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.write()
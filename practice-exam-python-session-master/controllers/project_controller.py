@@ -1,4 +1,7 @@
+from copy import copy
 from models.project import Project
+from database.database_manager import PAGE_SIZE, STREAM_CHUNK_SIZE
+from database.pagination import Page
 
 class ProjectController:
     def __init__(self, db_manager) -> None:
@@ -8,12 +11,40 @@ class ProjectController:
         project = Project(name, description, start_date, end_date)
         return self.db.add_project(project)
 
+    def add_projects_bulk(self, projects) -> list[int]:
+        return self.db.add_projects_bulk(projects)
+
     def get_project(self, project_id) -> Project | None:
         return self.db.get_project_by_id(project_id)
 
+    def get_projects_by_ids(self, project_ids) -> dict[int, Project]:
+        return self.db.get_projects_by_ids(project_ids)
+
     def get_all_projects(self) -> list[Project]:
         return self.db.get_all_projects()
 
+    def count_projects(self, **filters) -> int:
+        return self.db.count_projects(**filters)
+
+    def exists_projects(self, **filters) -> bool:
+        return self.db.exists_projects(**filters)
+
+    def get_status_counts(self) -> dict[int, dict[str, int]]:
+        # Task counts by status for every project, from a single grouped query
+        counts = {}
+        for (project_id, status), count in self.db.count_tasks_by("project_id", "status").items():
+            counts.setdefault(project_id, {})[status] = count
+        return counts
+
+    def get_projects_page(self, after=None, limit=PAGE_SIZE, order_by="id") -> Page:
+        return self.db.get_projects_page(after, limit, order_by)
+
+    def get_projects(self, fields=None, parse_dates=False, **filters) -> list[tuple]:
+        return self.db.get_projects(fields, parse_dates, **filters)
+
+    def iter_projects(self, chunk_size=STREAM_CHUNK_SIZE):
+        return self.db.iter_projects(chunk_size)
+
     def update_project(self, project_id, **kwargs) -> bool:
         return self.db.update_project(project_id, **kwargs)
 
@@ -21,14 +52,17 @@ class ProjectController:
         return self.db.delete_project(project_id)
 
     def update_project_status(self, project_id, new_status) -> bool:
-        project = self.db.get_project_by_id(project_id)
-        if not project:
-            return False
-        project.update_status(new_status)
-        return self.db.update_project(project_id, status=new_status)
+        with self.db.transaction():
+            project = self.db.get_project_by_id(project_id)
+            if not project:
+                return False
+            # A copy keeps the cached instance unchanged until the commit
+            copy(project).update_status(new_status)
+            return self.db.update_project(project_id, status=new_status)
 
     def get_project_progress(self, project_id) -> float:
-        project = self.db.get_project_by_id(project_id)
-        if not project:
-            return 0.0
-        return project.get_progress()
+        # Share of completed tasks, read from the trigger-maintained counters
+        return self.db.get_project_progress(project_id)
+
+    def get_all_project_progress(self) -> dict[int, float]:
+        return self.db.get_all_project_progress()
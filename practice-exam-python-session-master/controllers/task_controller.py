@@ -1,4 +1,9 @@
+from copy import copy
 from models.task import Task
+from models.task_batch import TaskBatch
+from database.database_manager import PAGE_SIZE, STREAM_CHUNK_SIZE, TaskDetails
+from database.pagination import Page
+from controllers.task_query import TaskQuery
 
 class TaskController:
     def __init__(self, db_manager) -> None:
@@ -8,9 +13,19 @@ class TaskController:
         task = Task(title, description, priority, due_date, project_id, assignee_id)
         return self.db.add_task(task)
 
+    def add_tasks_bulk(self, tasks) -> list[int]:
+        return self.db.add_tasks_bulk(tasks)
+
     def get_task(self, task_id) -> Task | None:
         return self.db.get_task_by_id(task_id)
 
+    def get_tasks_by_ids(self, task_ids) -> dict[int, Task]:
+        return self.db.get_tasks_by_ids(task_ids)
+
+    def get_tasks_with_details(self, **filters) -> list[TaskDetails]:
+        # Assignee and project come from the same query, not one lookup per task
+        return self.db.get_tasks_with_details(**filters)
+
     def get_all_tasks(self) -> list[Task]:
         return self.db.get_all_tasks()
 
@@ -20,23 +35,85 @@ class TaskController:
     def delete_task(self, task_id) -> bool:
         return self.db.delete_task(task_id)
 
-    def search_tasks(self, query) -> list[Task]:
-        return self.db.search_tasks(query)
+    def search_tasks(self, query, limit=None, offset=0) -> list[Task]:
+        return self.db.search_tasks(query, limit, offset)
 
     def update_task_status(self, task_id, new_status) -> bool:
-        task = self.db.get_task_by_id(task_id)
-        if not task:
-            return False
-        # Validation happens in model
-        task.update_status(new_status)
-        return self.db.update_task(task_id, status=new_status)
+        with self.db.transaction():
+            task = self.db.get_task_by_id(task_id)
+            if not task:
+                return False
+            # Validation happens in model, on a copy: the task may be the
+            # cached instance other threads read before this commits
+            copy(task).update_status(new_status)
+            return self.db.update_task(task_id, status=new_status)
+
+    def update_tasks_status(self, task_ids, new_status) -> int:
+        # All status changes are committed together or not at all
+        updated = 0
+        with self.db.transaction():
+            tasks = self.db.get_tasks_by_ids(task_ids)
+            for task_id in task_ids:
+                task = tasks.get(task_id)
+                if not task:
+                    continue
+                copy(task).update_status(new_status)
+                if self.db.update_task(task_id, status=new_status):
+                    updated += 1
+        return updated
+
+    def bulk_update_status(self, filters, new_status) -> int:
+        if new_status not in Task.STATUSES:
+            raise ValueError(f"Invalid status: {new_status}. Must be one of {set(Task.STATUSES)}")
+        return self.db.update_tasks_where(filters, status=new_status)
 
-    def get_overdue_tasks(self) -> list[Task]:
-        tasks = self.db.get_all_tasks()
-        return [t for t in tasks if t.is_overdue()]
+    def reassign_tasks(self, from_user, to_user) -> int:
+        return self.db.update_tasks_where({"assignee_id": from_user}, assignee_id=to_user)
+
+    def delete_tasks_where(self, **filters) -> int:
+        return self.db.delete_tasks_where(**filters)
+
+    def get_overdue_tasks(self, now=None, limit=None) -> list[Task]:
+        return self.db.get_overdue_tasks(now, limit)
+
+    def overdue_count(self, now=None) -> int:
+        return self.db.overdue_count(now)
 
     def get_tasks_by_project(self, project_id) -> list[Task]:
         return self.db.get_tasks_by_project(project_id)
 
     def get_tasks_by_user(self, user_id) -> list[Task]:
-        return self.db.get_tasks_by_user(user_id)
\ No newline at end of file
+        return self.db.get_tasks_by_user(user_id)
+
+    def get_tasks_page(self, after=None, limit=PAGE_SIZE, order_by="id") -> Page:
+        return self.db.get_tasks_page(after, limit, order_by)
+
+    def query(self) -> TaskQuery:
+        return TaskQuery(self.db)
+
+    def get_tasks(self, fields=None, parse_dates=False, **filters) -> list[tuple]:
+        return self.db.get_tasks(fields, parse_dates, **filters)
+
+    def count_tasks(self, **filters) -> int:
+        return self.db.count_tasks(**filters)
+
+    def exists_tasks(self, **filters) -> bool:
+        return self.db.exists_tasks(**filters)
+
+    def count_tasks_by(self, *columns, **filters) -> dict:
+        return self.db.count_tasks_by(*columns, **filters)
+
+    def get_task_batch(self) -> TaskBatch:
+        return self.db.get_task_batch()
+
+    def iter_tasks(self, chunk_size=STREAM_CHUNK_SIZE):
+        return self.db.iter_tasks(chunk_size)
+
+    def iter_search_tasks(self, query, chunk_size=STREAM_CHUNK_SIZE):
+        return self.db.iter_search_tasks(query, chunk_size)
+
+    def iter_tasks_by_project(self, project_id, chunk_size=STREAM_CHUNK_SIZE):
+        return self.db.iter_tasks_by_project(project_id, chunk_size)
+
+    def iter_tasks_by_user(self, user_id, chunk_size=STREAM_CHUNK_SIZE):
+        return self.db.iter_tasks_by_user(user_id, chunk_size)
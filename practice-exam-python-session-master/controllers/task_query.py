@@ -0,0 +1,97 @@
+from datetime import datetime
+from functools import lru_cache
+from models.task import Task
+from database.database_manager import PAGE_ORDERINGS
+
+# Conditions are compiled in this fixed order, so equal filters always give
+# the same SQL text and sqlite3 reuses its prepared statement
+CONDITION_ORDER = ("status", "priority_min", "priority_max", "due_from", "due_to",
+                   "project_id", "assignee_id")
+
+
+def _in_list(column, count) -> str:
+    return f"{column} IN ({', '.join('?' * count)})" if count else "0"
+
+
+def _date(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+@lru_cache(maxsize=256)
+def _compile(shape, order_by, descending, limited) -> str:
+    where = f"WHERE {' AND '.join(shape)}" if shape else ""
+    direction = "DESC" if descending else "ASC"
+    # id breaks ties so the order is stable between calls
+    order = f"ORDER BY {order_by} {direction}" + (f", id {direction}" if order_by != "id" else "")
+    return f"SELECT * FROM tasks {where} {order}" + (" LIMIT ?" if limited else "")
+
+
+class TaskQuery:
+    def __init__(self, db_manager) -> None:
+        self.db = db_manager
+        self._conditions = {}
+        self._order_by = "id"
+        self._descending = False
+        self._limit = None
+
+    def status(self, *statuses) -> "TaskQuery":
+        invalid = set(statuses) - set(Task.STATUSES)
+        if invalid:
+            raise ValueError(f"Invalid status: {invalid}. Must be one of {set(Task.STATUSES)}")
+        self._conditions["status"] = (_in_list("status", len(statuses)), statuses)
+        return self
+
+    def priority_between(self, low=None, high=None) -> "TaskQuery":
+        self._set_bound("priority_min", "priority >= ?", low)
+        self._set_bound("priority_max", "priority <= ?", high)
+        return self
+
+    def due_between(self, start=None, end=None) -> "TaskQuery":
+        # Half-open window: start <= due_date < end
+        self._set_bound("due_from", "due_date >= ?", _date(start))
+        self._set_bound("due_to", "due_date < ?", _date(end))
+        return self
+
+    def in_projects(self, *project_ids) -> "TaskQuery":
+        self._conditions["project_id"] = (_in_list("project_id", len(project_ids)), project_ids)
+        return self
+
+    def assigned_to(self, *user_ids) -> "TaskQuery":
+        self._conditions["assignee_id"] = (_in_list("assignee_id", len(user_ids)), user_ids)
+        return self
+
+    def order_by(self, column, descending=False) -> "TaskQuery":
+        if column not in PAGE_ORDERINGS["tasks"]:
+            raise ValueError(
+                f"Invalid ordering: {column}. Must be one of {PAGE_ORDERINGS['tasks']}"
+            )
+        self._order_by = column
+        self._descending = descending
+        return self
+
+    def limit(self, count) -> "TaskQuery":
+        if count is not None and count < 0:
+            raise ValueError(f"Invalid limit: {count}")
+        self._limit = count
+        return self
+
+    def to_sql(self) -> tuple[str, tuple]:
+        present = [name for name in CONDITION_ORDER if name in self._conditions]
+        shape = tuple(self._conditions[name][0] for name in present)
+        params = [param for name in present for param in self._conditions[name][1]]
+        if self._limit is not None:
+            params.append(self._limit)
+        sql = _compile(shape, self._order_by, self._descending, self._limit is not None)
+        return sql, tuple(params)
+
+    def all(self) -> list[Task]:
+        return self.db.query_tasks(*self.to_sql())
+
+    def explain(self) -> list[str]:
+        return self.db.explain(*self.to_sql())
+
+    def _set_bound(self, name, fragment, value) -> None:
+        if value is None:
+            self._conditions.pop(name, None)
+        else:
+            self._conditions[name] = (fragment, (value,))
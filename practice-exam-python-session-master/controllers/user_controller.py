@@ -1,4 +1,6 @@
 from models.user import User
+from database.database_manager import PAGE_SIZE, STREAM_CHUNK_SIZE
+from database.pagination import Page
 
 class UserController:
     def __init__(self, db_manager) -> None:
@@ -8,12 +10,38 @@ class UserController:
         user = User(username, email, role)
         return self.db.add_user(user)
 
+    def add_users_bulk(self, users) -> list[int]:
+        return self.db.add_users_bulk(users)
+
     def get_user(self, user_id) -> User | None:
         return self.db.get_user_by_id(user_id)
 
+    def get_users_by_ids(self, user_ids) -> dict[int, User]:
+        return self.db.get_users_by_ids(user_ids)
+
     def get_all_users(self) -> list[User]:
         return self.db.get_all_users()
 
+    def count_users(self, **filters) -> int:
+        return self.db.count_users(**filters)
+
+    def exists_users(self, **filters) -> bool:
+        return self.db.exists_users(**filters)
+
+    def count_user_tasks(self, user_id, status=None) -> int:
+        if status is None:
+            return self.db.count_tasks(assignee_id=user_id)
+        return self.db.count_tasks(assignee_id=user_id, status=status)
+
+    def get_users_page(self, after=None, limit=PAGE_SIZE, order_by="id") -> Page:
+        return self.db.get_users_page(after, limit, order_by)
+
+    def get_users(self, fields=None, parse_dates=False, **filters) -> list[tuple]:
+        return self.db.get_users(fields, parse_dates, **filters)
+
+    def iter_users(self, chunk_size=STREAM_CHUNK_SIZE):
+        return self.db.iter_users(chunk_size)
+
     def update_user(self, user_id, **kwargs) -> bool:
         return self.db.update_user(user_id, **kwargs)
 
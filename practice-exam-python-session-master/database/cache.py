@@ -0,0 +1,104 @@
+# Read-through identity map for entities loaded by id.
+# Each entity type has its own bounded LRU; writes through DatabaseManager
+# invalidate the affected ids once they are committed.
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    def __init__(self, maxsize) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size: {maxsize}")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped by every invalidation. A value loaded while an invalidation
+        # happened may already be stale and is not stored.
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(self, key, load, store=True):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            generation = self._generation
+        value = load(key)
+        # Missing rows are not cached, a later insert would not invalidate them
+        if store and value is not None:
+            self.put(key, value, generation)
+        return value
+
+    def get_many(self, keys, load_many, store=True) -> dict:
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+            missing = [key for key in keys if key not in found]
+            self.hits += len(found)
+            self.misses += len(missing)
+            generation = self._generation
+        if missing:
+            loaded = load_many(missing)
+            if store:
+                for key, value in loaded.items():
+                    self.put(key, value, generation)
+            found.update(loaded)
+        return found
+
+    def put(self, key, value, generation=None) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class EntityCache:
+    def __init__(self, maxsize=1024) -> None:
+        self.tasks = LRUCache(maxsize)
+        self.projects = LRUCache(maxsize)
+        self.users = LRUCache(maxsize)
+
+    def clear(self) -> None:
+        self.tasks.clear()
+        self.projects.clear()
+        self.users.clear()
+
+    def stats(self) -> dict:
+        return {
+            "tasks": self.tasks.stats(),
+            "projects": self.projects.stats(),
+            "users": self.users.stats(),
+        }
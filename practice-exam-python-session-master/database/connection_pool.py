@@ -0,0 +1,78 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    def __init__(self, db_path, size=5, timeout=30.0, connect=None) -> None:
+        if size < 1:
+            raise ValueError(f"Invalid pool size: {size}")
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._connect = connect or self._default_connect
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def _default_connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, check_same_thread=False)
+
+    def acquire(self, timeout=None) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._create_or_wait(timeout)
+
+    def _create_or_wait(self, timeout) -> sqlite3.Connection:
+        if self._reserve():
+            return self._create()
+        try:
+            return self._idle.get(timeout=self.timeout if timeout is None else timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No free connection in pool of {self.size}") from None
+
+    def _reserve(self) -> bool:
+        with self._lock:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _create(self) -> sqlite3.Connection:
+        try:
+            return self._connect()
+        except BaseException:
+            # Give the slot back, otherwise a failed connect shrinks the pool for good
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def release(self, conn) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        if self._closed:
+            conn.close()
+            return
+        self._idle.put_nowait(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        # Connections still checked out are closed when they are released
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
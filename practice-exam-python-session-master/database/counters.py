@@ -0,0 +1,68 @@
+# Per-project task counters maintained by triggers on tasks, so project
+# progress is a primary key lookup instead of a scan over the project's tasks.
+
+_STATUS_COLUMNS = ("pending", "in_progress", "completed")
+
+
+def _adjust(row, sign) -> str:
+    deltas = ", ".join(f"{status} = {status} {sign} ({row}.status IS '{status}')"
+                       for status in _STATUS_COLUMNS)
+    return f'''
+        UPDATE project_task_counts SET total = total {sign} 1, {deltas}
+        WHERE project_id = {row}.project_id;
+    '''
+
+
+def _ensure_row(row) -> str:
+    return f'''
+        INSERT INTO project_task_counts (project_id)
+        SELECT {row}.project_id WHERE {row}.project_id IS NOT NULL
+        ON CONFLICT (project_id) DO NOTHING;
+    '''
+
+
+PROJECT_COUNTER_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS project_task_counts (
+        project_id INTEGER PRIMARY KEY,
+        total INTEGER NOT NULL DEFAULT 0,
+        pending INTEGER NOT NULL DEFAULT 0,
+        in_progress INTEGER NOT NULL DEFAULT 0,
+        completed INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS project_counts_insert AFTER INSERT ON tasks BEGIN
+        {_ensure_row("new")}
+        {_adjust("new", "+")}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS project_counts_delete AFTER DELETE ON tasks BEGIN
+        {_adjust("old", "-")}
+    END
+    ''',
+    f'''
+    CREATE TRIGGER IF NOT EXISTS project_counts_update
+    AFTER UPDATE OF status, project_id ON tasks BEGIN
+        {_adjust("old", "-")}
+        {_ensure_row("new")}
+        {_adjust("new", "+")}
+    END
+    ''',
+]
+
+REBUILD_PROJECT_COUNTERS = [
+    "DELETE FROM project_task_counts",
+    f'''
+    INSERT INTO project_task_counts (project_id, total, {", ".join(_STATUS_COLUMNS)})
+    SELECT project_id, COUNT(*), {", ".join(f"SUM(status IS '{s}')" for s in _STATUS_COLUMNS)}
+    FROM tasks WHERE project_id IS NOT NULL
+    GROUP BY project_id
+    ''',
+]
+
+
+def create_project_counters(cursor) -> None:
+    for statement in PROJECT_COUNTER_SCHEMA + REBUILD_PROJECT_COUNTERS:
+        cursor.execute(statement)
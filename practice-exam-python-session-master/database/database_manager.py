@@ -1,28 +1,352 @@
 import sqlite3
 import os
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from models.task import Task
 from models.project import Project
 from models.user import User
+from models.task_batch import TaskBatch
 from datetime import datetime
+import itertools
+from itertools import islice
+from database.connection_pool import ConnectionPool
+from database.profiles import apply_profile, get_profile
+from database import migrations
+from database.counters import REBUILD_PROJECT_COUNTERS
+from database.cache import EntityCache
+from database.search import build_match_query
+from database.pagination import Page, decode_cursor, encode_cursor, keyset_query
+from database.filters import compile_filters
+from database.instrumentation import Instrumentation
+
+BULK_CHUNK_SIZE = 1000
+STREAM_CHUNK_SIZE = 500
+PAGE_SIZE = 50
+# Ids per IN (...) lookup, well below SQLite's limit on bound parameters
+IN_CHUNK_SIZE = 500
+
+# Rows are plain tuples in declared column order, decoded positionally
+COLUMNS = {
+    "tasks": ("id", "title", "description", "priority", "status", "due_date", "project_id",
+              "assignee_id"),
+    "projects": ("id", "name", "description", "start_date", "end_date", "status"),
+    "users": ("id", "username", "email", "role", "registration_date"),
+}
+
+# Columns stored as ISO strings and exposed as datetime by the models
+DATE_COLUMNS = {
+    "tasks": ("due_date",),
+    "projects": ("start_date", "end_date"),
+    "users": ("registration_date",),
+}
+
+# A task with its assignee and project resolved; either may be None
+TaskDetails = namedtuple("TaskDetails", ("task", "assignee", "project"))
+
+TASK_DETAILS_QUERY = '''
+    SELECT tasks.*, users.*, projects.* FROM (SELECT * FROM tasks {where}) AS tasks
+    LEFT JOIN users ON users.id = tasks.assignee_id
+    LEFT JOIN projects ON projects.id = tasks.project_id
+    ORDER BY tasks.id
+'''
+
+# Fills TaskBatch columns; due dates become UTC epoch seconds in SQLite
+TASK_BATCH_QUERY = '''
+    SELECT id, priority, status, (julianday(due_date) - 2440587.5) * 86400.0,
+           project_id, assignee_id
+    FROM tasks
+'''
+
+# Columns a page can be ordered by; each one is backed by an index
+PAGE_ORDERINGS = {
+    "tasks": ("id", "priority", "due_date"),
+    "projects": ("id", "name"),
+    "users": ("id", "username"),
+}
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@lru_cache(maxsize=None)
+def _projection_row(table, fields):
+    return namedtuple(f"{table.capitalize()}Row", fields)
+
+
+def _date_parsing_row(row_type, positions):
+    def make(row):
+        values = list(row)
+        for position in positions:
+            if values[position]:
+                values[position] = datetime.fromisoformat(values[position])
+        return row_type._make(values)
+    return make
+
 
 class DatabaseManager:
-    def __init__(self, db_path="tasks.db") -> None:
+    def __init__(self, db_path="tasks.db", pool_size=None, profile=None, cache_size=None) -> None:
         self.db_path = db_path
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        self.cursor = self.conn.cursor()
+        self.profile = get_profile(profile)
+        self.cache = EntityCache(cache_size) if cache_size else None
+        self.instrumentation = None
+        self.pool = None
+        self.conn = None
+        self._commits = itertools.count(1)
+        self._fts_enabled = None
+        # Transaction state is per thread: in pooled mode each thread pins
+        # its own connection for the duration of a transaction() block.
+        self._local = threading.local()
+        if pool_size:
+            if db_path == ":memory:":
+                raise ValueError("Pooled mode requires a database file")
+            self.pool = ConnectionPool(db_path, pool_size, connect=self._connect_pooled)
+        else:
+            self.conn = self._connect()
+
+    def _connect(self, check_same_thread=True) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        apply_profile(conn, self.profile)
+        return conn
+
+    def _connect_pooled(self) -> sqlite3.Connection:
+        return self._connect(check_same_thread=False)
 
     def close(self) -> None:
-        self.conn.close()
+        self.disable_instrumentation()
+        if self.pool is not None:
+            self.pool.close()
+        else:
+            self.conn.close()
+
+    def enable_cache(self, maxsize=1024) -> None:
+        self.cache = EntityCache(maxsize)
+
+    def disable_cache(self) -> None:
+        self.cache = None
+
+    def enable_instrumentation(self, slow_ms=100.0, slow_log=None) -> Instrumentation:
+        self.disable_instrumentation()
+        self.instrumentation = Instrumentation(slow_ms, slow_log)
+        return self.instrumentation
+
+    def disable_instrumentation(self) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.close()
+            self.instrumentation = None
+
+    def query_stats(self) -> list[dict]:
+        if self.instrumentation is None:
+            return []
+        return self.instrumentation.snapshot()
+
+    def _entity_cache(self, kind):
+        if self.cache is None:
+            return None
+        return getattr(self.cache, kind)
+
+    def _written(self, kind, entity_id) -> bool:
+        # Ids this thread's transaction has changed; their cached values are
+        # older than what the transaction sees
+        pending = getattr(self._local, 'invalidations', None) or ()
+        return (kind, None) in pending or (kind, entity_id) in pending
+
+    def _get_by_id(self, kind, entity_id, load):
+        entity_cache = self._entity_cache(kind)
+        if entity_cache is None:
+            return load(entity_id)
+        if not getattr(self._local, 'depth', 0):
+            return entity_cache.get_or_load(entity_id, load)
+        if self._written(kind, entity_id):
+            return load(entity_id)
+        # Rows read inside a transaction may be uncommitted, so they are not stored
+        return entity_cache.get_or_load(entity_id, load, store=False)
+
+    def _invalidate(self, kind, entity_id=None) -> None:
+        # entity_id None drops every cached entity of the kind. Inside a
+        # transaction eviction waits for COMMIT: evicting earlier lets another
+        # thread cache the old committed row again before the change is visible
+        pending = getattr(self._local, 'invalidations', None)
+        if pending is not None:
+            pending.append((kind, entity_id))
+        else:
+            self._evict(kind, entity_id)
+
+    def _evict(self, kind, entity_id) -> None:
+        if self.cache is None:
+            return
+        entity_cache = getattr(self.cache, kind)
+        if entity_id is None:
+            entity_cache.clear()
+        else:
+            entity_cache.invalidate(entity_id)
+
+    def _evict_pending(self) -> None:
+        pending, self._local.invalidations = self._local.invalidations, []
+        for kind, entity_id in pending:
+            self._evict(kind, entity_id)
+
+    @contextmanager
+    def _connection(self):
+        pinned = getattr(self._local, 'conn', None)
+        if pinned is not None:
+            yield pinned
+        elif self.pool is None:
+            yield self.conn
+        else:
+            with self.pool.connection() as conn:
+                yield conn
+
+    @contextmanager
+    def _cursor(self):
+        # Every call gets its own cursor so lastrowid/rowcount never race
+        with self._connection() as conn:
+            instrumentation = self.instrumentation
+            if instrumentation is None:
+                yield conn.cursor()
+                return
+            cursor = conn.cursor(instrumentation.cursor)
+            try:
+                yield cursor
+            finally:
+                cursor.finish()
+
+    @contextmanager
+    def transaction(self):
+        # The outermost block owns a real transaction, nested blocks become
+        # savepoints. Methods called inside skip their own commits (_commit).
+        depth = getattr(self._local, 'depth', 0)
+        with self._connection() as conn:
+            self._begin(conn, depth)
+            self._local.conn = conn
+            self._local.depth = depth + 1
+            if depth == 0:
+                self._local.invalidations = []
+            try:
+                yield self
+            except BaseException:
+                self._rollback(conn, depth)
+                raise
+            else:
+                self._release(conn, depth)
+            finally:
+                self._local.depth = depth
+                if depth == 0:
+                    self._local.conn = None
+                    self._local.invalidations = None
+
+    def _begin(self, conn, depth) -> None:
+        if depth > 0:
+            conn.execute(f'SAVEPOINT sp_{depth}')
+        elif not conn.in_transaction:
+            # Take the write lock up front: a deferred transaction that reads
+            # and then writes fails with "database is locked" (not retried by
+            # the busy timeout) when another connection committed in between
+            conn.execute('BEGIN IMMEDIATE')
+
+    def _rollback(self, conn, depth) -> None:
+        if depth > 0:
+            conn.execute(f'ROLLBACK TO sp_{depth}')
+            conn.execute(f'RELEASE sp_{depth}')
+        else:
+            conn.rollback()
+
+    def _release(self, conn, depth) -> None:
+        if depth > 0:
+            conn.execute(f'RELEASE sp_{depth}')
+        else:
+            conn.commit()
+            self._evict_pending()
+            self._after_commit(conn)
+
+    def _commit(self, conn) -> None:
+        if getattr(self._local, 'depth', 0) == 0:
+            conn.commit()
+            self._after_commit(conn)
+
+    def _after_commit(self, conn) -> None:
+        if self.profile is None:
+            return
+        if next(self._commits) % self.profile["checkpoint_every"] == 0:
+            conn.execute(f'PRAGMA wal_checkpoint({self.profile["checkpoint_mode"]})')
+
+    def checkpoint(self, mode="PASSIVE") -> tuple:
+        # Returns (busy, wal frames, checkpointed frames) as reported by SQLite
+        if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        row = self._fetch_one(f'PRAGMA wal_checkpoint({mode})')
+        return tuple(row)
+
+    def _write(self, query, params=()) -> sqlite3.Cursor:
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            self._commit(cursor.connection)
+        return cursor
+
+    def _fetch_one(self, query, params=()):
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchone()
+
+    def _fetch_all(self, query, params=()) -> list:
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def _fetch_models(self, row_to_model, query, params=()) -> list:
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            return list(map(row_to_model, cursor.fetchall()))
+
+    def _iter_rows(self, query, params=(), chunk_size=STREAM_CHUNK_SIZE):
+        # In pooled mode the connection stays checked out until the generator
+        # is exhausted or closed
+        with self._cursor() as cursor:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield from rows
 
     def create_tables(self) -> None:
         # Stub method calling specific creation methods to maintain compatibility
         self.create_user_table()
         self.create_project_table()
         self.create_task_table()
+        self.migrate()
+
+    def migrate(self) -> int:
+        with self._cursor() as cursor:
+            version = migrations.get_version(cursor)
+        for migration in migrations.pending_migrations(version):
+            with self.transaction(), self._cursor() as cursor:
+                migrations.apply_migration(cursor, migration)
+            version = migration[0]
+        self._fts_enabled = None
+        return version
+
+    def _has_task_search_index(self) -> bool:
+        if self._fts_enabled is None:
+            row = self._fetch_one(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+            )
+            self._fts_enabled = row is not None
+        return self._fts_enabled
+
+    def explain(self, query, params=()) -> list[str]:
+        rows = self._fetch_all(f'EXPLAIN QUERY PLAN {query}', params)
+        return [row[3] for row in rows]
 
     def create_task_table(self) -> None:
-        self.cursor.execute('''
+        self._write('''
             CREATE TABLE IF NOT EXISTS tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -36,10 +360,9 @@ class DatabaseManager:
                 FOREIGN KEY (assignee_id) REFERENCES users (id)
             )
         ''')
-        self.conn.commit()
 
     def create_project_table(self) -> None:
-        self.cursor.execute('''
+        self._write('''
             CREATE TABLE IF NOT EXISTS projects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
@@ -49,10 +372,9 @@ class DatabaseManager:
                 status TEXT
             )
         ''')
-        self.conn.commit()
 
     def create_user_table(self) -> None:
-        self.cursor.execute('''
+        self._write('''
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT NOT NULL,
@@ -61,30 +383,45 @@ class DatabaseManager:
                 registration_date TEXT
             )
         ''')
-        self.conn.commit()
 
     # --- TASKS ---
     def add_task(self, task: Task) -> int:
-        self.cursor.execute('''
+        return self._write('''
             INSERT INTO tasks (title, description, priority, status, due_date, project_id, assignee_id)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (task.title, task.description, task.priority, task.status, 
               task.due_date.isoformat() if task.due_date else None, 
-              task.project_id, task.assignee_id))
-        self.conn.commit()
-        return self.cursor.lastrowid
+              task.project_id, task.assignee_id)).lastrowid
+
+    def add_tasks_bulk(self, tasks, chunk_size=BULK_CHUNK_SIZE) -> list[int]:
+        rows = ((task.title, task.description, task.priority, task.status,
+                 task.due_date.isoformat() if task.due_date else None,
+                 task.project_id, task.assignee_id) for task in tasks)
+        return self._insert_many('''
+            INSERT INTO tasks
+                (title, description, priority, status, due_date, project_id, assignee_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', rows, chunk_size)
 
     def get_task_by_id(self, task_id) -> Task | None:
-        self.cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
-        row = self.cursor.fetchone()
+        return self._get_by_id('tasks', task_id, self._load_task)
+
+    def _load_task(self, task_id) -> Task | None:
+        row = self._fetch_one('SELECT * FROM tasks WHERE id = ?', (task_id,))
         if row:
             return self._row_to_task(row)
         return None
 
+    def get_tasks_by_ids(self, task_ids) -> dict[int, Task]:
+        return self._get_by_ids("tasks", self._row_to_task, task_ids)
+
+    def get_tasks_with_details(self, **filters) -> list[TaskDetails]:
+        where, params = compile_filters(COLUMNS["tasks"], filters)
+        query = TASK_DETAILS_QUERY.format(where=where)
+        return self._fetch_models(self._row_to_task_details, query, params)
+
     def get_all_tasks(self) -> list[Task]:
-        self.cursor.execute('SELECT * FROM tasks')
-        rows = self.cursor.fetchall()
-        return [self._row_to_task(row) for row in rows]
+        return self._fetch_models(self._row_to_task, 'SELECT * FROM tasks')
 
     def update_task(self, task_id, **kwargs) -> bool:
         if not kwargs:
@@ -108,57 +445,206 @@ class DatabaseManager:
         
         values.append(task_id)
         query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
-        self.cursor.execute(query, tuple(values))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        updated = self._write(query, tuple(values)).rowcount > 0
+        self._invalidate('tasks', task_id)
+        return updated
 
     def delete_task(self, task_id) -> bool:
-        self.cursor.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        deleted = self._write('DELETE FROM tasks WHERE id = ?', (task_id,)).rowcount > 0
+        self._invalidate('tasks', task_id)
+        return deleted
+
+    def update_tasks_where(self, filters, **values) -> int:
+        return self._update_where("tasks", filters, values)
 
-    def search_tasks(self, query) -> list[Task]:
+    def delete_tasks_where(self, **filters) -> int:
+        return self._delete_where("tasks", filters)
+
+    def search_tasks(self, query, limit=None, offset=0) -> list[Task]:
+        query, params = self._search_tasks_query(query, limit, offset)
+        return self._fetch_models(self._row_to_task, query, params)
+
+    def iter_search_tasks(self, query, chunk_size=STREAM_CHUNK_SIZE):
+        rows = self._iter_rows(*self._search_tasks_query(query), chunk_size)
+        yield from map(self._row_to_task, rows)
+
+    def _search_tasks_query(self, query, limit=None, offset=0) -> tuple[str, tuple]:
+        limit = -1 if limit is None else limit
+        match = build_match_query(query)
+        if match is None or not self._has_task_search_index():
+            return self._like_search_query(query, limit, offset)
+        # Title hits weigh more than description hits in the bm25 ranking
+        return '''
+            SELECT tasks.* FROM tasks
+            JOIN (
+                SELECT rowid, bm25(tasks_fts, 10.0, 1.0) AS score FROM tasks_fts
+                WHERE tasks_fts MATCH ?
+                ORDER BY score LIMIT ? OFFSET ?
+            ) AS hits ON tasks.id = hits.rowid
+            ORDER BY hits.score
+        ''', (match, limit, offset)
+
+    @staticmethod
+    def _like_search_query(query, limit=-1, offset=0) -> tuple[str, tuple]:
         search_query = f"%{query}%"
-        self.cursor.execute('''
+        return '''
             SELECT * FROM tasks 
             WHERE title LIKE ? OR description LIKE ?
-        ''', (search_query, search_query))
-        rows = self.cursor.fetchall()
-        return [self._row_to_task(row) for row in rows]
+            LIMIT ? OFFSET ?
+        ''', (search_query, search_query, limit, offset)
 
     def get_tasks_by_project(self, project_id) -> list[Task]:
-        self.cursor.execute('SELECT * FROM tasks WHERE project_id = ?', (project_id,))
-        rows = self.cursor.fetchall()
-        return [self._row_to_task(row) for row in rows]
+        query = 'SELECT * FROM tasks WHERE project_id = ?'
+        return self._fetch_models(self._row_to_task, query, (project_id,))
 
     def get_tasks_by_user(self, user_id) -> list[Task]:
-        self.cursor.execute('SELECT * FROM tasks WHERE assignee_id = ?', (user_id,))
-        rows = self.cursor.fetchall()
-        return [self._row_to_task(row) for row in rows]
+        query = 'SELECT * FROM tasks WHERE assignee_id = ?'
+        return self._fetch_models(self._row_to_task, query, (user_id,))
+
+    def query_tasks(self, query, params=()) -> list[Task]:
+        return self._fetch_models(self._row_to_task, query, params)
+
+    def get_tasks(self, fields=None, parse_dates=False, **filters) -> list[tuple]:
+        return self._select_fields("tasks", fields, filters, parse_dates)
+
+    def count_tasks(self, **filters) -> int:
+        return self._count("tasks", filters)
+
+    def exists_tasks(self, **filters) -> bool:
+        return self._exists("tasks", filters)
+
+    def count_tasks_by(self, *columns, **filters) -> dict:
+        # One GROUP BY query; keys are column values, tuples for several columns
+        unknown = [c for c in columns if c not in COLUMNS["tasks"]]
+        if not columns or unknown:
+            raise ValueError(
+                f"Invalid grouping: {unknown or columns}. Must be from {COLUMNS['tasks']}"
+            )
+        where, params = compile_filters(COLUMNS["tasks"], filters)
+        group = ", ".join(columns)
+        query = f'SELECT {group}, COUNT(*) FROM tasks {where} GROUP BY {group}'
+        rows = self._fetch_all(query, params)
+        if len(columns) == 1:
+            return {row[0]: row[1] for row in rows}
+        return {row[:-1]: row[-1] for row in rows}
+
+    def get_task_batch(self) -> TaskBatch:
+        batch = TaskBatch()
+        batch.extend(self._iter_rows(TASK_BATCH_QUERY))
+        return batch
+
+    def iter_task_batches(self, chunk_size=BULK_CHUNK_SIZE):
+        for rows in _chunked(self._iter_rows(TASK_BATCH_QUERY, (), chunk_size), chunk_size):
+            batch = TaskBatch()
+            batch.extend(rows)
+            yield batch
+
+    def get_overdue_tasks(self, now=None, limit=None) -> list[Task]:
+        # Same rule as Task.is_overdue(); ISO strings compare like datetimes
+        now = now or datetime.now()
+        return self._fetch_models(self._row_to_task, '''
+            SELECT * FROM tasks
+            WHERE due_date < ? AND (status IS NULL OR status != 'completed')
+            ORDER BY due_date, id LIMIT ?
+        ''', (now.isoformat(), -1 if limit is None else limit))
+
+    def overdue_count(self, now=None) -> int:
+        now = now or datetime.now()
+        row = self._fetch_one('''
+            SELECT COUNT(*) FROM tasks
+            WHERE due_date < ? AND (status IS NULL OR status != 'completed')
+        ''', (now.isoformat(),))
+        return row[0]
+
+    def get_tasks_page(self, after=None, limit=PAGE_SIZE, order_by="id") -> Page:
+        return self._get_page("tasks", self._row_to_task, after, limit, order_by)
+
+    def iter_tasks(self, chunk_size=STREAM_CHUNK_SIZE):
+        rows = self._iter_rows('SELECT * FROM tasks', (), chunk_size)
+        yield from map(self._row_to_task, rows)
+
+    def iter_tasks_by_project(self, project_id, chunk_size=STREAM_CHUNK_SIZE):
+        rows = self._iter_rows('SELECT * FROM tasks WHERE project_id = ?', (project_id,),
+                               chunk_size)
+        yield from map(self._row_to_task, rows)
+
+    def iter_tasks_by_user(self, user_id, chunk_size=STREAM_CHUNK_SIZE):
+        rows = self._iter_rows('SELECT * FROM tasks WHERE assignee_id = ?', (user_id,), chunk_size)
+        yield from map(self._row_to_task, rows)
 
     # --- PROJECTS ---
     def add_project(self, project: Project) -> int:
-        self.cursor.execute('''
+        return self._write('''
             INSERT INTO projects (name, description, start_date, end_date, status)
             VALUES (?, ?, ?, ?, ?)
         ''', (project.name, project.description, 
               project.start_date.isoformat() if project.start_date else None, 
               project.end_date.isoformat() if project.end_date else None, 
-              project.status))
-        self.conn.commit()
-        return self.cursor.lastrowid
+              project.status)).lastrowid
+
+    def add_projects_bulk(self, projects, chunk_size=BULK_CHUNK_SIZE) -> list[int]:
+        rows = ((project.name, project.description,
+                 project.start_date.isoformat() if project.start_date else None,
+                 project.end_date.isoformat() if project.end_date else None,
+                 project.status) for project in projects)
+        return self._insert_many('''
+            INSERT INTO projects (name, description, start_date, end_date, status)
+            VALUES (?, ?, ?, ?, ?)
+        ''', rows, chunk_size)
 
     def get_project_by_id(self, project_id) -> Project | None:
-        self.cursor.execute('SELECT * FROM projects WHERE id = ?', (project_id,))
-        row = self.cursor.fetchone()
+        return self._get_by_id('projects', project_id, self._load_project)
+
+    def _load_project(self, project_id) -> Project | None:
+        row = self._fetch_one('SELECT * FROM projects WHERE id = ?', (project_id,))
         if row:
             return self._row_to_project(row)
         return None
 
+    def get_projects_by_ids(self, project_ids) -> dict[int, Project]:
+        return self._get_by_ids("projects", self._row_to_project, project_ids)
+
     def get_all_projects(self) -> list[Project]:
-        self.cursor.execute('SELECT * FROM projects')
-        rows = self.cursor.fetchall()
-        return [self._row_to_project(row) for row in rows]
+        return self._fetch_models(self._row_to_project, 'SELECT * FROM projects')
+
+    def get_projects(self, fields=None, parse_dates=False, **filters) -> list[tuple]:
+        return self._select_fields("projects", fields, filters, parse_dates)
+
+    def count_projects(self, **filters) -> int:
+        return self._count("projects", filters)
+
+    def exists_projects(self, **filters) -> bool:
+        return self._exists("projects", filters)
+
+    def get_project_task_counts(self, project_id) -> dict:
+        row = self._fetch_one('''
+            SELECT total, pending, in_progress, completed FROM project_task_counts
+            WHERE project_id = ?
+        ''', (project_id,))
+        return dict(zip(("total", "pending", "in_progress", "completed"), row or (0, 0, 0, 0)))
+
+    def get_project_progress(self, project_id) -> float:
+        counts = self.get_project_task_counts(project_id)
+        if not counts["total"]:
+            return 0.0
+        return counts["completed"] / counts["total"]
+
+    def get_all_project_progress(self) -> dict[int, float]:
+        rows = self._fetch_all('SELECT project_id, total, completed FROM project_task_counts')
+        return {project_id: completed / total if total else 0.0
+                for project_id, total, completed in rows}
+
+    def rebuild_project_counters(self) -> None:
+        with self.transaction(), self._cursor() as cursor:
+            for statement in REBUILD_PROJECT_COUNTERS:
+                cursor.execute(statement)
+
+    def get_projects_page(self, after=None, limit=PAGE_SIZE, order_by="id") -> Page:
+        return self._get_page("projects", self._row_to_project, after, limit, order_by)
+
+    def iter_projects(self, chunk_size=STREAM_CHUNK_SIZE):
+        rows = self._iter_rows('SELECT * FROM projects', (), chunk_size)
+        yield from map(self._row_to_project, rows)
 
     def update_project(self, project_id, **kwargs) -> bool:
         if not kwargs:
@@ -178,36 +664,70 @@ class DatabaseManager:
         values.append(project_id)
         
         query = f"UPDATE projects SET {', '.join(updates)} WHERE id = ?"
-        self.cursor.execute(query, tuple(values))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        updated = self._write(query, tuple(values)).rowcount > 0
+        self._invalidate('projects', project_id)
+        return updated
+
+    def update_projects_where(self, filters, **values) -> int:
+        return self._update_where("projects", filters, values)
 
     def delete_project(self, project_id) -> bool:
-        self.cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        deleted = self._write('DELETE FROM projects WHERE id = ?', (project_id,)).rowcount > 0
+        self._invalidate('projects', project_id)
+        return deleted
 
     # --- USERS ---
     def add_user(self, user: User) -> int:
-        self.cursor.execute('''
+        return self._write('''
             INSERT INTO users (username, email, role, registration_date)
             VALUES (?, ?, ?, ?)
         ''', (user.username, user.email, user.role, 
-              user.registration_date.isoformat() if user.registration_date else None))
-        self.conn.commit()
-        return self.cursor.lastrowid
+              user.registration_date.isoformat() if user.registration_date else None)).lastrowid
+
+    def add_users_bulk(self, users, chunk_size=BULK_CHUNK_SIZE) -> list[int]:
+        rows = ((user.username, user.email, user.role,
+                 user.registration_date.isoformat() if user.registration_date else None)
+                for user in users)
+        return self._insert_many('''
+            INSERT INTO users (username, email, role, registration_date)
+            VALUES (?, ?, ?, ?)
+        ''', rows, chunk_size)
 
     def get_user_by_id(self, user_id) -> User | None:
-        self.cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-        row = self.cursor.fetchone()
+        return self._get_by_id('users', user_id, self._load_user)
+
+    def _load_user(self, user_id) -> User | None:
+        row = self._fetch_one('SELECT * FROM users WHERE id = ?', (user_id,))
         if row:
             return self._row_to_user(row)
         return None
 
+    def get_user_by_email(self, email) -> User | None:
+        row = self._fetch_one('SELECT * FROM users WHERE email = ?', (email,))
+        if row:
+            return self._row_to_user(row)
+        return None
+
+    def get_users_by_ids(self, user_ids) -> dict[int, User]:
+        return self._get_by_ids("users", self._row_to_user, user_ids)
+
     def get_all_users(self) -> list[User]:
-        self.cursor.execute('SELECT * FROM users')
-        rows = self.cursor.fetchall()
-        return [self._row_to_user(row) for row in rows]
+        return self._fetch_models(self._row_to_user, 'SELECT * FROM users')
+
+    def get_users(self, fields=None, parse_dates=False, **filters) -> list[tuple]:
+        return self._select_fields("users", fields, filters, parse_dates)
+
+    def count_users(self, **filters) -> int:
+        return self._count("users", filters)
+
+    def exists_users(self, **filters) -> bool:
+        return self._exists("users", filters)
+
+    def get_users_page(self, after=None, limit=PAGE_SIZE, order_by="id") -> Page:
+        return self._get_page("users", self._row_to_user, after, limit, order_by)
+
+    def iter_users(self, chunk_size=STREAM_CHUNK_SIZE):
+        yield from map(self._row_to_user, self._iter_rows('SELECT * FROM users', (), chunk_size))
 
     def update_user(self, user_id, **kwargs) -> bool:
         if not kwargs:
@@ -226,34 +746,180 @@ class DatabaseManager:
             return False
         values.append(user_id)
         query = f"UPDATE users SET {', '.join(updates)} WHERE id = ?"
-        self.cursor.execute(query, tuple(values))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        updated = self._write(query, tuple(values)).rowcount > 0
+        self._invalidate('users', user_id)
+        return updated
+
+    def update_users_where(self, filters, **values) -> int:
+        return self._update_where("users", filters, values)
 
     def delete_user(self, user_id) -> bool:
-        self.cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        deleted = self._write('DELETE FROM users WHERE id = ?', (user_id,)).rowcount > 0
+        self._invalidate('users', user_id)
+        return deleted
 
     # --- Helpers ---
+    def _insert_many(self, query, rows, chunk_size) -> list[int]:
+        # All chunks share one transaction. While it holds the write lock the
+        # AUTOINCREMENT ids of a chunk are contiguous, so they can be derived
+        # from last_insert_rowid() instead of fetching them back row by row.
+        ids = []
+        with self.transaction(), self._cursor() as cursor:
+            for chunk in _chunked(rows, chunk_size):
+                cursor.executemany(query, chunk)
+                cursor.execute('SELECT last_insert_rowid()')
+                last_id = cursor.fetchone()[0]
+                ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+        return ids
+
+    def _get_by_ids(self, table, row_to_model, ids) -> dict:
+        ids = list(dict.fromkeys(ids))
+        load = partial(self._load_by_ids, table, row_to_model)
+        entity_cache = self._entity_cache(table)
+        if entity_cache is None:
+            return load(ids)
+        if not getattr(self._local, 'depth', 0):
+            return entity_cache.get_many(ids, load)
+        written = [entity_id for entity_id in ids if self._written(table, entity_id)]
+        unchanged = [entity_id for entity_id in ids if not self._written(table, entity_id)]
+        models = entity_cache.get_many(unchanged, load, store=False)
+        if written:
+            models.update(load(written))
+        return models
+
+    def _load_by_ids(self, table, row_to_model, ids) -> dict:
+        models = {}
+        for chunk in _chunked(ids, IN_CHUNK_SIZE):
+            where, params = compile_filters(("id",), {"id": chunk})
+            for model in self._fetch_models(row_to_model, f'SELECT * FROM {table} {where}', params):
+                models[model.id] = model
+        return models
+
+    def _count(self, table, filters) -> int:
+        where, params = compile_filters(COLUMNS[table], filters)
+        return self._fetch_one(f'SELECT COUNT(*) FROM {table} {where}', params)[0]
+
+    def _exists(self, table, filters) -> bool:
+        # EXISTS stops at the first matching row
+        where, params = compile_filters(COLUMNS[table], filters)
+        return bool(self._fetch_one(f'SELECT EXISTS (SELECT 1 FROM {table} {where})', params)[0])
+
+    def insert_rows(self, table, rows) -> int:
+        # Rows are tuples in COLUMNS order; an id of None lets SQLite assign one
+        columns = COLUMNS[table]
+        placeholders = ", ".join("?" * len(columns))
+        query = f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({placeholders})'
+        with self.transaction(), self._cursor() as cursor:
+            cursor.executemany(query, rows)
+            return cursor.rowcount
+
+    def get_import_checkpoint(self, source, kind) -> int:
+        row = self._fetch_one('SELECT kind, rows FROM import_checkpoints WHERE source = ?',
+                              (source,))
+        if row is None:
+            return 0
+        if row[0] != kind:
+            raise ValueError(f"Checkpoint for {source} belongs to a {row[0]} import, not {kind}")
+        return row[1]
+
+    def save_import_checkpoint(self, source, kind, rows) -> None:
+        self._write('''
+            INSERT INTO import_checkpoints (source, kind, rows) VALUES (?, ?, ?)
+            ON CONFLICT (source) DO UPDATE SET rows = excluded.rows
+        ''', (source, kind, rows))
+
+    def clear_import_checkpoint(self, source) -> None:
+        self._write('DELETE FROM import_checkpoints WHERE source = ?', (source,))
+
+    def _update_where(self, table, filters, values) -> int:
+        columns = COLUMNS[table][1:]
+        unknown = [k for k in values if k not in columns]
+        if not values or unknown:
+            raise ValueError(f"Invalid update: {unknown or values}. Must be from {columns}")
+        where, params = self._bulk_where(table, filters)
+        assignments = ", ".join(f"{k} = ?" for k in values)
+        values = tuple(v.isoformat() if isinstance(v, datetime) else v for v in values.values())
+        with self.transaction():
+            query = f"UPDATE {table} SET {assignments} {where}"
+            updated = self._write(query, values + params).rowcount
+            # Affected ids are unknown here, drop every cached entity of this kind
+            self._invalidate(table)
+        return updated
+
+    def _delete_where(self, table, filters) -> int:
+        where, params = self._bulk_where(table, filters)
+        with self.transaction():
+            deleted = self._write(f"DELETE FROM {table} {where}", params).rowcount
+            self._invalidate(table)
+        return deleted
+
+    def _bulk_where(self, table, filters) -> tuple[str, tuple]:
+        # An empty filter would touch the whole table, which is never intended
+        if not filters:
+            raise ValueError(f"Bulk change on {table} requires at least one filter")
+        return compile_filters(COLUMNS[table], filters)
+
+    def _select_fields(self, table, fields, filters, parse_dates=False) -> list[tuple]:
+        # Projection reads for list screens: only the requested columns, as
+        # namedtuples, no model construction. Dates stay ISO strings unless
+        # parse_dates asks for datetime values as the models show them.
+        fields = tuple(fields or COLUMNS[table])
+        unknown = set(fields) - set(COLUMNS[table])
+        if unknown:
+            raise ValueError(f"Invalid fields: {unknown}. Must be from {COLUMNS[table]}")
+        where, params = compile_filters(COLUMNS[table], filters)
+        row_type = _projection_row(table, fields)
+        make = row_type._make
+        dates = [position for position, field in enumerate(fields) if field in DATE_COLUMNS[table]]
+        if parse_dates and dates:
+            make = _date_parsing_row(row_type, dates)
+        query = f"SELECT {', '.join(fields)} FROM {table} {where} ORDER BY id"
+        return self._fetch_models(make, query, params)
+
+    def _get_page(self, table, row_to_model, after, limit, order_by) -> Page:
+        if order_by not in PAGE_ORDERINGS[table]:
+            raise ValueError(
+                f"Invalid order_by: {order_by}. Must be one of {PAGE_ORDERINGS[table]}"
+            )
+        if limit < 1:
+            raise ValueError(f"Invalid page size: {limit}")
+        # One extra row tells whether there is a next page
+        query, params = keyset_query(table, order_by, decode_cursor(after, order_by), limit + 1)
+        rows = self._fetch_all(query, params)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            position = COLUMNS[table].index(order_by)
+            next_cursor = encode_cursor(order_by, rows[-1][position], rows[-1][0])
+        return Page([row_to_model(row) for row in rows], next_cursor)
+
+    # Decoders bypass the model constructors: rows are already validated
+    # data, and __init__ would assign most attributes twice. Dates go into
+    # the backing slots as stored ISO strings and are parsed on first access.
     def _row_to_task(self, row) -> Task:
-        due_date = datetime.fromisoformat(row['due_date']) if row['due_date'] else None
-        task = Task(row['title'], row['description'], row['priority'], due_date, row['project_id'], row['assignee_id'])
-        task.id = row['id']
-        task.status = row['status']
+        task = Task.__new__(Task)
+        (task.id, task.title, task.description, task.priority, task.status,
+         task._due_date, task.project_id, task.assignee_id) = row
         return task
 
+    def _row_to_task_details(self, row) -> TaskDetails:
+        # Joined row layout: task columns, then user columns, then project columns
+        user_start = len(COLUMNS["tasks"])
+        project_start = user_start + len(COLUMNS["users"])
+        user_row, project_row = row[user_start:project_start], row[project_start:]
+        return TaskDetails(
+            self._row_to_task(row[:user_start]),
+            self._row_to_user(user_row) if user_row[0] is not None else None,
+            self._row_to_project(project_row) if project_row[0] is not None else None,
+        )
+
     def _row_to_project(self, row) -> Project:
-        start_date = datetime.fromisoformat(row['start_date']) if row['start_date'] else None
-        end_date = datetime.fromisoformat(row['end_date']) if row['end_date'] else None
-        project = Project(row['name'], row['description'], start_date, end_date)
-        project.id = row['id']
-        project.status = row['status']
+        project = Project.__new__(Project)
+        (project.id, project.name, project.description, project._start_date, project._end_date,
+         project.status) = row
         return project
 
     def _row_to_user(self, row) -> User:
-        user = User(row['username'], row['email'], row['role'])
-        user.id = row['id']
-        if row['registration_date']:
-            user.registration_date = datetime.fromisoformat(row['registration_date'])
-        return user
\ No newline at end of file
+        user = User.__new__(User)
+        user.id, user.username, user.email, user.role, user._registration_date = row
+        return user
@@ -0,0 +1,28 @@
+# Compiles keyword filters into a parameterized WHERE clause.
+# A scalar compares with =, None with IS NULL and a list, tuple or set
+# becomes an IN (...) list. Column names are checked against the table.
+from datetime import datetime
+
+
+def _param(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def compile_filters(columns, filters) -> tuple[str, tuple]:
+    clauses = []
+    params = []
+    for column, value in filters.items():
+        if column not in columns:
+            raise ValueError(f"Invalid filter: {column}. Must be one of {set(columns)}")
+        if value is None:
+            clauses.append(f"{column} IS NULL")
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            values = list(value)
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})" if values else "0")
+            params.extend(_param(v) for v in values)
+        else:
+            clauses.append(f"{column} = ?")
+            params.append(_param(value))
+    if not clauses:
+        return "", ()
+    return "WHERE " + " AND ".join(clauses), tuple(params)
@@ -0,0 +1,196 @@
+# Opt-in query instrumentation for DatabaseManager.
+# Cursors created while it is enabled time every execute and fetch, and the
+# results are aggregated per (DatabaseManager method, statement shape):
+# call count, latency histogram and rows. Statements slower than slow_ms
+# get their EXPLAIN QUERY PLAN captured and, when a file path is given, are
+# written to that instance's own rotating slow-query log.
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, float("inf"))
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+SLOW_LOG_MAX_BYTES = 10 * 1024 * 1024
+SLOW_LOG_BACKUP_COUNT = 5
+
+_MANAGER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database_manager.py")
+
+
+@lru_cache(maxsize=1024)
+def statement_shape(sql) -> str:
+    # Whitespace is collapsed and chunked IN (?, ?, ...) lists fold into one shape
+    shape = re.sub(r"\s+", " ", sql).strip()
+    return re.sub(r"\?(?:\s*,\s*\?)+", "?, ...", shape)
+
+
+def _call_site() -> str:
+    # Innermost public DatabaseManager method on the stack
+    frame = sys._getframe(2)
+    caller = frame.f_code.co_name
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename == _MANAGER_FILE and code.co_name.isidentifier() \
+                and not code.co_name.startswith("_"):
+            return code.co_name
+        frame = frame.f_back
+    return caller
+
+
+def _bucket_label(bound) -> str:
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+
+class QueryStats:
+    __slots__ = ("calls", "total_ms", "max_ms", "rows", "buckets", "plan")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS_MS)
+        self.plan = None
+
+    def add(self, elapsed_ms, rows) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    # Time spent inside execute and fetch calls is summed until the next
+    # execute or finish(); time the caller spends between fetches is not counted
+    def __init__(self, connection, instrumentation) -> None:
+        super().__init__(connection)
+        self._instrumentation = instrumentation
+        self._pending = None
+
+    def execute(self, sql, params=()):
+        self.finish()
+        start = time.perf_counter()
+        super().execute(sql, params)
+        elapsed = time.perf_counter() - start
+        self._pending = [sql, params, _call_site(), elapsed, max(self.rowcount, 0)]
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self.finish()
+        start = time.perf_counter()
+        super().executemany(sql, seq_of_params)
+        elapsed = time.perf_counter() - start
+        self._pending = [sql, None, _call_site(), elapsed, max(self.rowcount, 0)]
+        return self
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._track(start, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._track(start, len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._track(start, len(rows))
+        return rows
+
+    def finish(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._instrumentation.record(self.connection, *pending)
+
+    def _track(self, start, rows) -> None:
+        if self._pending is not None:
+            self._pending[3] += time.perf_counter() - start
+            self._pending[4] += rows
+
+
+class Instrumentation:
+    def __init__(self, slow_ms=100.0, slow_log=None) -> None:
+        self.slow_ms = slow_ms
+        self._stats = {}
+        self._lock = threading.Lock()
+        # One logger per instance: a shared one would send every manager's slow
+        # queries to every log file, and to stderr when no file is given
+        self.logger = logging.getLogger(f"database.slow_queries.{id(self)}")
+        self.logger.propagate = False
+        self._handler = None
+        if slow_log is not None:
+            self._handler = RotatingFileHandler(
+                slow_log, maxBytes=SLOW_LOG_MAX_BYTES, backupCount=SLOW_LOG_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+            self._handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.logger.addHandler(self._handler)
+            self.logger.setLevel(logging.INFO)
+
+    def cursor(self, connection) -> InstrumentedCursor:
+        return InstrumentedCursor(connection, self)
+
+    def record(self, connection, sql, params, method, elapsed, rows) -> None:
+        elapsed_ms = elapsed * 1000
+        shape = statement_shape(sql)
+        with self._lock:
+            stats = self._stats.get((method, shape))
+            if stats is None:
+                stats = self._stats[(method, shape)] = QueryStats()
+            stats.add(elapsed_ms, rows)
+        if elapsed_ms < self.slow_ms:
+            return
+        plan = self._explain(connection, sql, params)
+        if plan is not None:
+            stats.plan = plan
+        if self._handler is not None:
+            self.logger.warning("slow query %.2f ms in %s, %d rows: %s | plan: %s",
+                                elapsed_ms, method, rows, shape, "; ".join(plan or ()))
+
+    def _explain(self, connection, sql, params):
+        # executemany batches have no single parameter set to explain
+        if params is None or not sql.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+        try:
+            return [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        except sqlite3.Error:
+            return None
+
+    def snapshot(self) -> list[dict]:
+        # Slowest statements by total time first
+        with self._lock:
+            result = [{
+                "method": method,
+                "statement": shape,
+                "calls": stats.calls,
+                "total_ms": stats.total_ms,
+                "mean_ms": stats.total_ms / stats.calls,
+                "max_ms": stats.max_ms,
+                "rows": stats.rows,
+                "histogram": {_bucket_label(bound): count
+                              for bound, count in zip(LATENCY_BUCKETS_MS, stats.buckets)},
+                "plan": stats.plan,
+            } for (method, shape), stats in self._stats.items()]
+        return sorted(result, key=lambda entry: entry["total_ms"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self.logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
@@ -0,0 +1,60 @@
+# Versioned schema migrations.
+# The schema version is stored in PRAGMA user_version. Migrations are applied
+# in order on startup, each one in its own transaction together with the
+# version bump. A step is either an SQL statement or a callable taking a cursor.
+
+from database.counters import create_project_counters
+from database.search import create_task_search_index
+
+MIGRATIONS = [
+    (1, "index tasks by project, assignee and status/due date", [
+        "CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks (project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_assignee_id ON tasks (assignee_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_due_date ON tasks (status, due_date)",
+    ]),
+    (2, "index users by email", [
+        "CREATE INDEX IF NOT EXISTS idx_users_email ON users (email)",
+    ]),
+    (3, "full-text search index over task title and description", [
+        create_task_search_index,
+    ]),
+    (4, "index columns used as keyset pagination orderings", [
+        "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date)",
+        "CREATE INDEX IF NOT EXISTS idx_projects_name ON projects (name)",
+        "CREATE INDEX IF NOT EXISTS idx_users_username ON users (username)",
+    ]),
+    (5, "per-project task counters maintained by triggers", [
+        create_project_counters,
+    ]),
+    (6, "resumable import checkpoints", [
+        """
+        CREATE TABLE IF NOT EXISTS import_checkpoints (
+            source TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            rows INTEGER NOT NULL
+        )
+        """,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(cursor) -> int:
+    cursor.execute("PRAGMA user_version")
+    return cursor.fetchone()[0]
+
+
+def pending_migrations(version) -> list:
+    return [migration for migration in MIGRATIONS if migration[0] > version]
+
+
+def apply_migration(cursor, migration) -> None:
+    version, _, steps = migration
+    for step in steps:
+        if callable(step):
+            step(cursor)
+        else:
+            cursor.execute(step)
+    cursor.execute(f"PRAGMA user_version = {int(version)}")
@@ -0,0 +1,67 @@
+# Keyset (seek) pagination helpers.
+# A page continues strictly after the (order column, id) pair of the last
+# row of the previous page, so every page is an index seek no matter how
+# deep into the table it is.
+import base64
+import json
+from collections import namedtuple
+
+Page = namedtuple("Page", ["items", "next_cursor"])
+
+
+def encode_cursor(order_by, value, row_id) -> str:
+    payload = json.dumps([order_by, value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _is_position(value, row_id) -> bool:
+    # Only values SQLite can bind; bool is an int subclass but never an id
+    return (value is None or isinstance(value, (str, int, float))) \
+        and isinstance(row_id, int) and not isinstance(row_id, bool)
+
+
+def _parse_cursor(cursor) -> tuple:
+    if isinstance(cursor, str):
+        try:
+            cursor_order, value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError):
+            pass
+        else:
+            if _is_position(value, row_id):
+                return cursor_order, value, row_id
+    raise ValueError(f"Invalid page cursor: {cursor!r}")
+
+
+def decode_cursor(cursor, order_by) -> tuple | None:
+    if cursor is None:
+        return None
+    cursor_order, value, row_id = _parse_cursor(cursor)
+    if cursor_order != order_by:
+        raise ValueError(f"Page cursor was issued for order_by={cursor_order!r}")
+    return value, row_id
+
+
+def keyset_query(table, column, position, limit) -> tuple[str, tuple]:
+    if position is None:
+        order = "id" if column == "id" else f"{column}, id"
+        return f"SELECT * FROM {table} ORDER BY {order} LIMIT ?", (limit,)
+    value, row_id = position
+    if column == "id":
+        return f"SELECT * FROM {table} WHERE id > ? ORDER BY id LIMIT ?", (row_id, limit)
+    # (column, id) > (value, id) split into two index seeks: the rest of the
+    # current column value and everything after it. NULLs sort first.
+    if value is None:
+        same, after, params = f"{column} IS NULL", f"{column} IS NOT NULL", ()
+    else:
+        same, after, params = f"{column} = ?", f"{column} > ?", (value,)
+    query = f'''
+        SELECT * FROM (
+            SELECT * FROM {table} WHERE {same} AND id > ? ORDER BY id LIMIT ?
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT * FROM {table} WHERE {after} ORDER BY {column}, id LIMIT ?
+        )
+        ORDER BY {column}, id LIMIT ?
+    '''
+    return query, params + (row_id, limit) + params + (limit, limit)
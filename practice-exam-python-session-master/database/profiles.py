@@ -0,0 +1,58 @@
+# Named PRAGMA profiles for DatabaseManager.
+# Every profile runs in WAL mode so readers are not blocked by a writer, and
+# pairs its PRAGMAs with a checkpoint policy: checkpoint_every commits the
+# WAL is checkpointed with checkpoint_mode on top of wal_autocheckpoint.
+
+PROFILES = {
+    "durable": {
+        "pragmas": (
+            ("journal_mode", "WAL"),
+            ("synchronous", "FULL"),
+            ("wal_autocheckpoint", 1000),
+        ),
+        "checkpoint_every": 100,
+        "checkpoint_mode": "PASSIVE",
+    },
+    "balanced": {
+        "pragmas": (
+            ("journal_mode", "WAL"),
+            ("synchronous", "NORMAL"),
+            ("cache_size", -64 * 1024),
+            ("mmap_size", 256 * 1024 * 1024),
+            ("temp_store", "MEMORY"),
+            ("wal_autocheckpoint", 1000),
+        ),
+        "checkpoint_every": 1000,
+        "checkpoint_mode": "PASSIVE",
+    },
+    "bulk-load": {
+        # Bulk commits are large: automatic checkpoints are switched off and
+        # the WAL is truncated explicitly so the file does not keep growing.
+        "pragmas": (
+            ("journal_mode", "WAL"),
+            ("synchronous", "OFF"),
+            ("cache_size", -256 * 1024),
+            ("mmap_size", 1024 * 1024 * 1024),
+            ("temp_store", "MEMORY"),
+            ("wal_autocheckpoint", 0),
+        ),
+        "checkpoint_every": 20,
+        "checkpoint_mode": "TRUNCATE",
+    },
+}
+
+
+def get_profile(name) -> dict | None:
+    # None keeps SQLite defaults (rollback journal, synchronous=FULL)
+    if name is None:
+        return None
+    if name not in PROFILES:
+        raise ValueError(f"Invalid profile: {name}. Must be one of {set(PROFILES)}")
+    return PROFILES[name]
+
+
+def apply_profile(conn, profile) -> None:
+    if profile is None:
+        return
+    for pragma, value in profile["pragmas"]:
+        conn.execute(f"PRAGMA {pragma} = {value}")
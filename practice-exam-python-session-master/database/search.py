@@ -0,0 +1,76 @@
+# Full-text search over tasks backed by an FTS5 external-content table.
+import re
+import sqlite3
+
+_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+_WORD_RE = re.compile(r'\w')
+
+TASK_SEARCH_TRIGGERS = [
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    ''',
+]
+
+
+def create_task_search_index(cursor) -> None:
+    # SQLite builds without FTS5 keep using the LIKE search, so a missing
+    # module is not an error here
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                title, description,
+                content='tasks', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        if "fts5" not in str(e):
+            raise
+        return
+    for trigger in TASK_SEARCH_TRIGGERS:
+        cursor.execute(trigger)
+    cursor.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def _quote(text) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _parse_terms(text) -> list[str]:
+    terms = []
+    for phrase, word in _TOKEN_RE.findall(text or ""):
+        if phrase and _WORD_RE.search(phrase):
+            terms.append(_quote(phrase))
+        elif word and _WORD_RE.search(word):
+            terms.append(_quote(word.rstrip("*")) + ("*" if word.endswith("*") else ""))
+    return terms
+
+
+def build_match_query(text) -> str | None:
+    # "quoted text" is a phrase, term* is a prefix query and the last bare
+    # term is always matched as a prefix so search-as-you-type works.
+    # Returns None when the text contains nothing searchable.
+    terms = _parse_terms(text)
+    if not terms:
+        return None
+    last = terms[-1]
+    if not last.endswith("*") and not text.rstrip().endswith('"'):
+        terms[-1] = last + "*"
+    return " ".join(terms)
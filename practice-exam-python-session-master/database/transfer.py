@@ -0,0 +1,144 @@
+# Streaming export and import of tasks, projects and users as CSV or JSON Lines.
+# Export walks the table with the iter_* readers and writes one record at a
+# time. Import reads the file lazily, validates each batch with the model
+# rules, inserts it in one transaction and records in the same transaction
+# how many records of the file are done, so a failed import resumes after
+# the last committed batch. Ids are kept, so references between tables
+# survive when users and projects are imported before tasks.
+import csv
+import json
+import os
+from datetime import datetime
+from itertools import islice
+from models.task import Task
+from models.project import Project
+from models.user import User
+from database.database_manager import BULK_CHUNK_SIZE, COLUMNS, _chunked
+
+FORMATS = ("csv", "jsonl")
+ITERATORS = {"tasks": "iter_tasks", "projects": "iter_projects", "users": "iter_users"}
+# CSV has no null, so NULL is written as this marker and an empty cell stays ""
+CSV_NULL = "\\N"
+
+
+def detect_format(path, fmt=None) -> str:
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Invalid format: {fmt}. Must be one of {FORMATS}")
+    return fmt
+
+
+def _check_kind(kind) -> None:
+    if kind not in ITERATORS:
+        raise ValueError(f"Invalid kind: {kind}. Must be one of {tuple(ITERATORS)}")
+
+
+def export_table(db, kind, path, fmt=None) -> int:
+    _check_kind(kind)
+    fmt = detect_format(path, fmt)
+    records = (model.to_dict() for model in getattr(db, ITERATORS[kind])())
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=COLUMNS[kind])
+            writer.writeheader()
+            for record in records:
+                writer.writerow({key: CSV_NULL if value is None else value
+                                 for key, value in record.items()})
+                count += 1
+        else:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    return count
+
+
+def _read_records(path, fmt):
+    with open(path, encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            for record in csv.DictReader(f):
+                yield {key: None if value == CSV_NULL else value for key, value in record.items()}
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _required(record, key):
+    # NOT NULL columns are checked here so the error names the record
+    value = record[key]
+    if value is None:
+        raise ValueError(f"Missing {key}")
+    return value
+
+
+def _optional_int(value):
+    return None if value is None else int(value)
+
+
+def _optional_date(value):
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _task_from_record(record) -> Task:
+    task = Task(_required(record, "title"), record.get("description"),
+                _optional_int(record.get("priority")), _optional_date(record.get("due_date")),
+                _optional_int(record.get("project_id")), _optional_int(record.get("assignee_id")))
+    task.update_status(record.get("status") or "pending")
+    return task
+
+
+def _project_from_record(record) -> Project:
+    project = Project(_required(record, "name"), record.get("description"),
+                      _optional_date(record.get("start_date")),
+                      _optional_date(record.get("end_date")))
+    project.update_status(record.get("status") or "active")
+    return project
+
+
+def _user_from_record(record) -> User:
+    # Emails are taken as stored: add_user does not check their format either
+    user = User(_required(record, "username"), _required(record, "email"), record["role"])
+    user.registration_date = _optional_date(record.get("registration_date"))
+    return user
+
+
+MODEL_BUILDERS = {
+    "tasks": _task_from_record, "projects": _project_from_record, "users": _user_from_record,
+}
+
+
+def _validate_batch(kind, records, first_number) -> list[tuple]:
+    # The whole batch is checked before anything is written, and every bad
+    # record in it is reported at once
+    rows, errors = [], []
+    for number, record in enumerate(records, first_number):
+        try:
+            model = MODEL_BUILDERS[kind](record)
+            model.id = _optional_int(record.get("id"))
+        except (KeyError, TypeError, ValueError) as exc:
+            errors.append(f"record {number}: {exc!r}")
+            continue
+        rows.append(tuple(model.to_dict()[column] for column in COLUMNS[kind]))
+    if errors:
+        raise ValueError(f"Invalid {kind} records: " + "; ".join(errors))
+    return rows
+
+
+def import_table(db, kind, path, fmt=None, chunk_size=BULK_CHUNK_SIZE) -> int:
+    # Returns the number of records imported by this call
+    _check_kind(kind)
+    fmt = detect_format(path, fmt)
+    source = os.path.abspath(path)
+    done = db.get_import_checkpoint(source, kind)
+    records = islice(_read_records(path, fmt), done, None)
+    imported = 0
+    for batch in _chunked(records, chunk_size):
+        rows = _validate_batch(kind, batch, done + 1)
+        with db.transaction():
+            db.insert_rows(kind, rows)
+            db.save_import_checkpoint(source, kind, done + len(rows))
+        done += len(rows)
+        imported += len(rows)
+    db.clear_import_checkpoint(source)
+    return imported
@@ -0,0 +1,140 @@
+# Group commit for bursts of small writes.
+# Callers enqueue DatabaseManager calls and get a Future back; a single
+# writer thread drains the queue into batches (up to max_batch operations or
+# max_delay seconds after the first one) and commits each batch once. Every
+# operation runs in its own savepoint, so a failing one only fails its own
+# future. Futures resolve after the batch has been committed.
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    def __init__(self, db_manager, max_batch=256, max_delay=0.0005, max_queue=10000,
+                 put_timeout=None) -> None:
+        if db_manager.pool is None:
+            raise ValueError("Write-behind needs a pooled DatabaseManager (pool_size)")
+        if max_batch < 1:
+            raise ValueError(f"Invalid batch size: {max_batch}")
+        self.db = db_manager
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.put_timeout = put_timeout
+        self.batches = 0
+        self.operations = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        # Held while checking _closed and enqueueing, so close() cannot slip
+        # in between and leave an operation behind the stop marker
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+            # A full queue blocks the caller (backpressure) until put_timeout
+            try:
+                self._queue.put((func, args, kwargs, future), timeout=self.put_timeout)
+            except queue.Full:
+                raise TimeoutError(
+                    f"Write-behind queue is full ({self._queue.maxsize} pending)"
+                ) from None
+        return future
+
+    def add_task(self, task) -> Future:
+        return self.submit(self.db.add_task, task)
+
+    def update_task(self, task_id, **kwargs) -> Future:
+        return self.submit(self.db.update_task, task_id, **kwargs)
+
+    def delete_task(self, task_id) -> Future:
+        return self.submit(self.db.delete_task, task_id)
+
+    def flush(self) -> None:
+        # Operations are committed in order, so this waits for all earlier ones
+        self.submit(lambda: None).result()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                self._commit_batch(batch)
+            if stop:
+                return
+
+    def _next_batch(self) -> tuple[list, bool]:
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _commit_batch(self, batch) -> None:
+        try:
+            outcomes = self._execute(batch)
+        except Exception as exc:
+            # The batch was not committed, so none of its operations happened
+            self._fail(batch, exc)
+            return
+        self.batches += 1
+        self.operations += len(outcomes)
+        self._resolve(outcomes)
+
+    def _execute(self, batch) -> list[tuple]:
+        outcomes = []
+        with self.db.transaction():
+            for func, args, kwargs, future in batch:
+                if future.set_running_or_notify_cancel():
+                    outcomes.append((future, *self._apply(func, args, kwargs)))
+        return outcomes
+
+    @staticmethod
+    def _fail(batch, exc) -> None:
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    @staticmethod
+    def _resolve(outcomes) -> None:
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _apply(self, func, args, kwargs) -> tuple:
+        try:
+            with self.db.transaction():
+                return func(*args, **kwargs), None
+        except Exception as exc:
+            return None, exc
@@ -2,29 +2,57 @@ from database.database_manager import DatabaseManager
 from controllers.task_controller import TaskController
 from controllers.project_controller import ProjectController
 from controllers.user_controller import UserController
+from controllers.metrics import (
+    MetricsFileWriter, MetricsRegistry, instrument_controller, register_database_gauges,
+    serve_metrics
+)
 from views.main_window import MainWindow
 import os
 
+
+def start_metrics(db, controllers, metrics_port, metrics_file):
+    registry = MetricsRegistry()
+    for controller in controllers:
+        instrument_controller(controller, registry)
+    register_database_gauges(registry, db)
+    server = serve_metrics(registry, int(metrics_port)) if metrics_port else None
+    writer = MetricsFileWriter(registry, metrics_file) if metrics_file else None
+    return server, writer
+
+
 def main():
     # Database path relative to main.py
     db_path = os.path.join(os.path.dirname(__file__), "database", "tasks.db")
-    db = DatabaseManager(db_path)
+    # Optional metrics: TASKS_METRICS_PORT serves /metrics, TASKS_METRICS_FILE dumps them
+    metrics_port = os.environ.get("TASKS_METRICS_PORT")
+    metrics_file = os.environ.get("TASKS_METRICS_FILE")
+    with_metrics = bool(metrics_port or metrics_file)
+    # Metrics are rendered off the GUI thread, which needs pooled connections
+    db = DatabaseManager(db_path, pool_size=2 if with_metrics else None)
     
-    # Create tables
-    db.create_user_table()
-    db.create_project_table()
-    db.create_task_table()
+    # Create tables and apply pending schema migrations
+    db.create_tables()
 
     # Initialize Controllers
     task_ctrl = TaskController(db)
     proj_ctrl = ProjectController(db)
     user_ctrl = UserController(db)
 
+    server = writer = None
+    if with_metrics:
+        server, writer = start_metrics(db, (task_ctrl, proj_ctrl, user_ctrl),
+                                       metrics_port, metrics_file)
+
     # Launch GUI
     app = MainWindow(task_ctrl, proj_ctrl, user_ctrl)
     app.run()
     
     # Cleanup on exit
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    if writer is not None:
+        writer.stop()
     db.close()
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Служебные команды для базы данных задач
+Запуск: python manage.py [--db PATH] <команда>
+"""
+
+import argparse
+import json
+import os
+import time
+
+from benchmarks.datasets import DEFAULT_SEED, build_dataset
+from benchmarks.load import DEFAULT_MIX, format_report, parse_mix, run_load
+from database.database_manager import BULK_CHUNK_SIZE, DatabaseManager
+from database.transfer import FORMATS, ITERATORS, export_table, import_table
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), "database", "tasks.db")
+DEFAULT_LOAD_DURATION = 10.0
+
+
+def rebuild_counters(db, args) -> None:
+    db.rebuild_project_counters()
+    print(f"Rebuilt task counters for {len(db.get_all_project_progress())} projects")
+
+
+def generate(db, args) -> None:
+    start = time.perf_counter()
+    dataset = build_dataset(
+        db, args.tasks, seed=args.seed, users=args.users, projects=args.projects,
+        assignee_skew=args.assignee_skew, due_spread_days=args.due_spread,
+        status_mix=tuple(float(w) for w in args.status_mix.split(",")),
+        description_words=args.description_words, unassigned=args.unassigned,
+    )
+    print(f"Generated {len(dataset['user_ids'])} users, {len(dataset['project_ids'])} projects and "
+          f"{len(dataset['task_ids'])} tasks in {time.perf_counter() - start:.1f} s")
+
+
+def load(db, args) -> None:
+    db.close()
+    # Without either limit the run is time-bound
+    duration = args.duration
+    if args.ops is None and duration is None:
+        duration = DEFAULT_LOAD_DURATION
+    report = run_load(args.db, workers=args.processes or args.threads, mix=parse_mix(args.mix),
+                      ops=args.ops, duration=duration, processes=bool(args.processes))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+def export(db, args) -> None:
+    count = export_table(db, args.kind, args.path, args.format)
+    print(f"Exported {count} {args.kind} to {args.path}")
+
+
+def import_(db, args) -> None:
+    # A failed import keeps its checkpoint; running the command again resumes it
+    count = import_table(db, args.kind, args.path, args.format, args.chunk_size)
+    print(f"Imported {count} {args.kind} from {args.path}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Task database maintenance commands")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="path to the SQLite database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-counters", help="recount per-project task counters")
+    rebuild.set_defaults(handler=rebuild_counters)
+
+    gen = commands.add_parser("generate",
+                              help="fill the database with synthetic data (bulk inserts)")
+    gen.add_argument("--tasks", type=int, default=10000)
+    gen.add_argument("--users", type=int, help="default: tasks / 50")
+    gen.add_argument("--projects", type=int, help="default: tasks / 200")
+    gen.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    gen.add_argument("--assignee-skew", type=float, default=0.0,
+                     help="Zipf exponent for assignees, 0 is uniform")
+    gen.add_argument("--due-spread", type=int, default=180, help="due dates within +-N days")
+    gen.add_argument("--status-mix", default="5,3,2",
+                     help="weights of pending,in_progress,completed")
+    gen.add_argument("--description-words", type=int, default=30)
+    gen.add_argument("--unassigned", type=float, default=0.2,
+                     help="share of tasks without assignee")
+    gen.set_defaults(handler=generate)
+
+    load_parser = commands.add_parser("load",
+                                      help="replay a mix of controller calls and report latency")
+    workers = load_parser.add_mutually_exclusive_group()
+    workers.add_argument("--threads", type=int, default=4)
+    workers.add_argument("--processes", type=int)
+    stop = load_parser.add_mutually_exclusive_group()
+    stop.add_argument("--ops", type=int, help="operations per worker")
+    stop.add_argument("--duration", type=float,
+                      help=f"seconds (default: {DEFAULT_LOAD_DURATION:g} unless --ops is given)")
+    load_parser.add_argument("--mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+                             help="operation=weight pairs, comma separated")
+    load_parser.add_argument("--output", help="write the report as JSON")
+    load_parser.set_defaults(handler=load)
+
+    for name, handler, help_text in (("export", export, "stream a table to CSV or JSON Lines"),
+                                     ("import", import_, "stream CSV or JSON Lines into a table")):
+        transfer = commands.add_parser(name, help=help_text)
+        transfer.add_argument("kind", choices=tuple(ITERATORS))
+        transfer.add_argument("path")
+        transfer.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+        transfer.set_defaults(handler=handler)
+    import_parser = commands.choices["import"]
+    import_parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE,
+                               help="records validated and committed per batch")
+    return parser
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    db = DatabaseManager(args.db)
+    try:
+        db.create_tables()
+        args.handler(db, args)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Date attribute for the slotted models. The row decoders store the ISO
+# string read from SQLite in the backing slot ("_" + name); it is parsed on
+# first access, so rows whose dates are never read skip fromisoformat.
+from datetime import datetime
+
+
+class IsoDate:
+    def __set_name__(self, owner, name) -> None:
+        self._slot = getattr(owner, f"_{name}")
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self._slot.__get__(instance, owner)
+        if value.__class__ is str:
+            value = datetime.fromisoformat(value)
+            self._slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        self._slot.__set__(instance, value)
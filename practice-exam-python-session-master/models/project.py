@@ -1,6 +1,11 @@
 from datetime import datetime
+from models.iso_date import IsoDate
 
 class Project:
+    __slots__ = ("id", "name", "description", "_start_date", "_end_date", "status")
+    start_date = IsoDate()
+    end_date = IsoDate()
+
     def __init__(self, name, description, start_date, end_date) -> None:
         self.id = None
         self.name = name
@@ -16,11 +21,6 @@ class Project:
         self.status = new_status
         return True
 
-    def get_progress(self) -> float:
-        # Progress calculation requires task data which is not available in the model alone.
-        # This will be handled by the controller or updated separately.
-        return 0.0
-
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -1,6 +1,12 @@
 from datetime import datetime
+from models.iso_date import IsoDate
 
 class Task:
+    __slots__ = ("id", "title", "description", "priority", "status", "_due_date", "project_id",
+                 "assignee_id")
+    STATUSES = ("pending", "in_progress", "completed")
+    due_date = IsoDate()
+
     def __init__(self, title, description, priority, due_date, project_id, assignee_id) -> None:
         self.id = None
         self.title = title
@@ -12,14 +18,14 @@ class Task:
         self.assignee_id = assignee_id
 
     def update_status(self, new_status) -> bool:
-        allowed_statuses = {"pending", "in_progress", "completed"}
+        allowed_statuses = set(self.STATUSES)
         if new_status not in allowed_statuses:
             raise ValueError(f"Invalid status: {new_status}. Must be one of {allowed_statuses}")
         self.status = new_status
         return True
 
     def is_overdue(self) -> bool:
-        if self.status == "completed":
+        if self.status == "completed" or self.due_date is None:
             return False
         return self.due_date < datetime.now()
 
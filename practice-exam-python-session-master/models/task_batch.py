@@ -0,0 +1,74 @@
+from array import array
+from datetime import datetime, timezone
+from math import isnan
+
+from models.task import Task
+
+NO_DUE_DATE = float("nan")
+UNKNOWN_STATUS = -1
+STATUS_CODES = {status: code for code, status in enumerate(Task.STATUSES)}
+
+
+def to_epoch(value) -> float:
+    # Due dates are stored as naive ISO strings; they are read as UTC both
+    # here and in the SQL that fills a batch, so the two always agree
+    if value is None:
+        return NO_DUE_DATE
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class TaskBatch:
+    # Columnar container: one typed array per field instead of one object
+    # per task. Missing ids and priorities are stored as 0.
+    __slots__ = ("ids", "priorities", "status_codes", "due_dates", "project_ids",
+                 "assignee_ids")
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        # priority is an unconstrained INTEGER column
+        self.priorities = array("q")
+        self.status_codes = array("b")
+        self.due_dates = array("d")
+        self.project_ids = array("q")
+        self.assignee_ids = array("q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, task_id, priority, status, due_epoch, project_id, assignee_id) -> None:
+        self.ids.append(task_id)
+        self.priorities.append(priority or 0)
+        self.status_codes.append(STATUS_CODES.get(status, UNKNOWN_STATUS))
+        self.due_dates.append(NO_DUE_DATE if due_epoch is None else due_epoch)
+        self.project_ids.append(project_id or 0)
+        self.assignee_ids.append(assignee_id or 0)
+
+    def extend(self, rows) -> None:
+        for row in rows:
+            self.append(*row)
+
+    def status(self, index) -> str | None:
+        code = self.status_codes[index]
+        return Task.STATUSES[code] if code != UNKNOWN_STATUS else None
+
+    def due_date(self, index) -> datetime | None:
+        epoch = self.due_dates[index]
+        if isnan(epoch):
+            return None
+        return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
+    def count_by_status(self) -> dict:
+        counts = {}
+        for code in self.status_codes:
+            status = Task.STATUSES[code] if code != UNKNOWN_STATUS else None
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    def overdue_ids(self, now=None) -> list[int]:
+        # Same rule as Task.is_overdue(); NaN never compares as overdue
+        now_epoch = to_epoch(now or datetime.now())
+        completed = STATUS_CODES["completed"]
+        return [task_id for task_id, code, due in zip(self.ids, self.status_codes, self.due_dates)
+                if code != completed and due < now_epoch]
@@ -1,7 +1,11 @@
 from datetime import datetime
 import re
+from models.iso_date import IsoDate
 
 class User:
+    __slots__ = ("id", "username", "email", "role", "_registration_date")
+    registration_date = IsoDate()
+
     def __init__(self, username, email, role) -> None:
         if role not in {"admin", "manager", "developer"}:
             raise ValueError(f"Invalid role: {role}")
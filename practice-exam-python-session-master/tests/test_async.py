@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from database.database_manager import DatabaseManager
+from controllers.async_controller import (
+    AsyncProjectController, AsyncTaskController, AsyncUserController, DatabaseExecutor
+)
+
+
+class TestAsyncControllers:
+    """Тесты для асинхронных контроллеров"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.temp_db.name, pool_size=4, profile="balanced")
+        self.db_manager.create_tables()
+        self.executor = DatabaseExecutor(self.db_manager, readers=2)
+
+    def teardown_method(self):
+        self.executor.shutdown()
+        self.db_manager.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def test_async_round_trip(self):
+        """Тест записи и чтения через асинхронные контроллеры"""
+        async def scenario():
+            users = AsyncUserController(self.executor)
+            projects = AsyncProjectController(self.executor)
+            tasks = AsyncTaskController(self.executor)
+
+            user_id = await users.add_user("async", "async@example.com", "developer")
+            project_id = await projects.add_project("Проект", "Описание", datetime.now(),
+                                                    datetime.now() + timedelta(days=5))
+            task_ids = await asyncio.gather(*(
+                tasks.add_task(f"Задача {i}", "Описание", 1, None, project_id, user_id)
+                for i in range(10)
+            ))
+            await tasks.update_task_status(task_ids[0], "completed")
+
+            counts, task, progress = await asyncio.gather(
+                tasks.count_tasks_by("status"), tasks.get_task(task_ids[0]),
+                projects.get_project_progress(project_id),
+            )
+            streamed = [t.id async for t in tasks.iter_tasks_by_user(user_id)]
+            queried = await tasks.run_query(tasks.controller.query().status("pending").limit(3))
+            return task_ids, counts, task, progress, streamed, queried
+
+        task_ids, counts, task, progress, streamed, queried = asyncio.run(scenario())
+        assert counts == {"pending": 9, "completed": 1}
+        assert task.status == "completed"
+        assert progress == pytest.approx(0.1)
+        assert streamed == sorted(task_ids)
+        assert len(queried) == 3
+
+    def test_stream_closed_early_releases_connection(self):
+        """Тест освобождения соединения при досрочном выходе из потока"""
+
+        async def scenario():
+            tasks = AsyncTaskController(self.executor)
+            await asyncio.gather(*(tasks.add_task(f"Задача {i}", "", 1, None, None, None)
+                                   for i in range(5)))
+            for _ in range(5):
+                stream = tasks.iter_tasks()
+                async for _ in stream:
+                    break
+                await stream.aclose()
+            return await tasks.count_tasks()
+
+        assert asyncio.run(scenario()) == 5
+        assert self.db_manager.pool._idle.qsize() == self.db_manager.pool._created
+
+    def test_requires_pool(self):
+        """Тест отказа без пула соединений"""
+        plain = DatabaseManager(":memory:")
+        with pytest.raises(ValueError):
+            DatabaseExecutor(plain)
+        with pytest.raises(ValueError):
+            DatabaseExecutor(self.db_manager, readers=4)
+        plain.close()
+
+    def test_requires_wal_profile(self):
+        """Тест отказа без режима WAL"""
+        journal = DatabaseManager(self.temp_db.name, pool_size=4)
+        try:
+            with pytest.raises(ValueError):
+                DatabaseExecutor(journal, readers=2)
+        finally:
+            journal.close()
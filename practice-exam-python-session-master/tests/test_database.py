@@ -0,0 +1,539 @@
+import json
+import pytest
+import sqlite3
+import sys
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from models.task import Task
+from models.project import Project
+from models.user import User
+from database.database_manager import DatabaseManager
+from database.transfer import export_table, import_table
+from database.write_behind import WriteBehindQueue
+
+
+class TestDatabaseManager:
+    """Тесты для DatabaseManager"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.temp_db.name)
+        self.db_manager.create_tables()
+
+        self.project_id = self.db_manager.add_project(
+            Project("Тестовый проект", "Описание проекта", datetime.now(),
+                    datetime.now() + timedelta(days=30))
+        )
+        self.user_id = self.db_manager.add_user(
+            User("test_user", "test@example.com", "developer")
+        )
+
+    def teardown_method(self):
+        self.db_manager.close()
+        os.unlink(self.temp_db.name)
+
+    def _make_task(self, title="Задача", due_date=None):
+        return Task(title, "Описание", 1, due_date or datetime.now() + timedelta(days=1),
+                    self.project_id, self.user_id)
+
+    def test_transaction_commits_on_exit(self):
+        """Тест фиксации транзакции при выходе из блока"""
+        with self.db_manager.transaction():
+            task_id = self.db_manager.add_task(self._make_task())
+            self.db_manager.update_task(task_id, status="in_progress")
+            assert self.db_manager.conn.in_transaction
+
+        assert not self.db_manager.conn.in_transaction
+        assert self.db_manager.get_task_by_id(task_id).status == "in_progress"
+
+    def test_transaction_rolls_back_on_error(self):
+        """Тест отката транзакции при исключении"""
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.add_task(self._make_task("Откатываемая задача"))
+                raise RuntimeError("boom")
+
+        assert self.db_manager.get_all_tasks() == []
+
+    def test_nested_transaction_uses_savepoint(self):
+        """Тест вложенной транзакции через SAVEPOINT"""
+        with self.db_manager.transaction():
+            outer_id = self.db_manager.add_task(self._make_task("Внешняя"))
+            with pytest.raises(ValueError):
+                with self.db_manager.transaction():
+                    self.db_manager.add_task(self._make_task("Вложенная"))
+                    raise ValueError("inner")
+
+        tasks = self.db_manager.get_all_tasks()
+        assert [t.id for t in tasks] == [outer_id]
+
+    def _increment_priority(self, task_id, rounds, errors):
+        db = DatabaseManager(self.temp_db.name)
+        try:
+            for _ in range(rounds):
+                with db.transaction():
+                    task = db.get_task_by_id(task_id)
+                    db.update_task(task_id, priority=task.priority + 1)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            db.close()
+
+    def _increment_concurrently(self, task_id, workers=4, rounds=50):
+        errors = []
+        threads = [threading.Thread(target=self._increment_priority, args=(task_id, rounds, errors))
+                   for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_concurrent_transactions_do_not_fail_on_lock(self):
+        """Тест отсутствия ошибок блокировки у параллельных транзакций"""
+        task_id = self.db_manager.add_task(self._make_task())
+        assert self._increment_concurrently(task_id) == []
+
+    def test_concurrent_read_modify_write_keeps_all_updates(self):
+        """Тест сохранения всех изменений параллельных транзакций"""
+        task_id = self.db_manager.add_task(self._make_task())
+        self._increment_concurrently(task_id)
+        assert self.db_manager.get_task_by_id(task_id).priority == 1 + 4 * 50
+
+    def test_pooled_mode_serves_worker_threads(self):
+        """Тест пула соединений при вызовах из рабочих потоков"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        pooled = DatabaseManager(self.temp_db.name, pool_size=4)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                task_ids = list(executor.map(
+                    lambda i: pooled.add_task(self._make_task(f"Задача {i}")), range(40)
+                ))
+                tasks = list(executor.map(pooled.get_task_by_id, task_ids))
+
+            assert len(set(task_ids)) == 40
+            assert [t.title for t in tasks] == [f"Задача {i}" for i in range(40)]
+            assert pooled.pool._created <= 4
+        finally:
+            pooled.close()
+
+    def test_pool_is_bounded(self):
+        """Тест ограничения размера пула"""
+        pooled = DatabaseManager(self.temp_db.name, pool_size=1)
+        pooled.pool.timeout = 0.01
+        try:
+            with pooled.pool.connection():
+                with pytest.raises(TimeoutError):
+                    pooled.pool.acquire()
+        finally:
+            pooled.close()
+
+    def test_pool_keeps_capacity_after_failed_connect(self):
+        """Тест сохранения размера пула после ошибки подключения"""
+        from database.connection_pool import ConnectionPool
+
+        attempts = []
+
+        def connect():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError("unable to open database file")
+            return sqlite3.connect(self.temp_db.name, check_same_thread=False)
+
+        pool = ConnectionPool(self.temp_db.name, size=1, timeout=0.01, connect=connect)
+        with pytest.raises(sqlite3.OperationalError):
+            pool.acquire()
+        with pool.connection() as conn:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+        pool.close()
+
+    def test_pooled_transaction_pins_connection(self):
+        """Тест транзакции в режиме пула"""
+        pooled = DatabaseManager(self.temp_db.name, pool_size=2)
+        try:
+            with pytest.raises(RuntimeError):
+                with pooled.transaction():
+                    pooled.add_task(self._make_task("Откатываемая задача"))
+                    raise RuntimeError("boom")
+            with pooled.transaction():
+                task_id = pooled.add_task(self._make_task("Сохраненная задача"))
+
+            assert [t.id for t in pooled.get_all_tasks()] == [task_id]
+        finally:
+            pooled.close()
+
+    def test_balanced_profile_applies_pragmas(self):
+        """Тест применения профиля PRAGMA"""
+        tuned = DatabaseManager(self.temp_db.name, profile="balanced")
+        try:
+            assert tuned._fetch_one("PRAGMA journal_mode")[0] == "wal"
+            assert tuned._fetch_one("PRAGMA synchronous")[0] == 1
+            assert tuned._fetch_one("PRAGMA temp_store")[0] == 2
+            tuned.add_task(self._make_task())
+            busy, _, _ = tuned.checkpoint("TRUNCATE")
+            assert busy == 0
+        finally:
+            tuned.close()
+
+    def test_unknown_profile(self):
+        """Тест неизвестного профиля"""
+        with pytest.raises(ValueError):
+            DatabaseManager(self.temp_db.name, profile="fastest")
+
+    def test_migrations_record_schema_version(self):
+        """Тест версии схемы после миграций"""
+        from database.migrations import LATEST_VERSION
+
+        assert self.db_manager._fetch_one("PRAGMA user_version")[0] == LATEST_VERSION
+        # Повторный запуск не применяет миграции заново
+        assert self.db_manager.migrate() == LATEST_VERSION
+
+    @pytest.mark.parametrize("query, params, index", [
+        ("SELECT * FROM tasks WHERE project_id = ?", (1,), "idx_tasks_project_id"),
+        ("SELECT * FROM tasks WHERE assignee_id = ?", (1,), "idx_tasks_assignee_id"),
+        ("SELECT * FROM tasks WHERE status = ? AND due_date < ?", ("pending", "2030-01-01"),
+         "idx_tasks_status_due_date"),
+        ("SELECT * FROM users WHERE email = ?", ("test@example.com",), "idx_users_email"),
+    ])
+    def test_hot_queries_use_indexes(self, query, params, index):
+        """Тест использования индексов горячими запросами"""
+        plan = " ".join(self.db_manager.explain(query, params))
+        assert f"USING INDEX {index}" in plan
+
+    def test_search_tasks_full_text(self):
+        """Тест полнотекстового поиска с ранжированием"""
+        in_description = self.db_manager.add_task(Task("Рефакторинг", "Отчет по релизу", 1, None,
+                                                       self.project_id, self.user_id))
+        in_title = self.db_manager.add_task(Task("Отчет за квартал", "Собрать данные", 1, None,
+                                                 self.project_id, self.user_id))
+        self.db_manager.add_task(Task("Другое", "Ничего общего", 1, None,
+                                      self.project_id, self.user_id))
+
+        assert [t.id for t in self.db_manager.search_tasks("отчет")] == [in_title, in_description]
+        assert [t.id for t in self.db_manager.search_tasks("Отч")] == [in_title, in_description]
+        assert [t.id for t in self.db_manager.search_tasks('"за квартал"')] == [in_title]
+        second_page = self.db_manager.search_tasks("отчет", limit=1, offset=1)
+        assert [t.id for t in second_page] == [in_description]
+
+    def test_search_index_follows_changes(self):
+        """Тест синхронизации поискового индекса с таблицей задач"""
+        task_id = self.db_manager.add_task(self._make_task("Черновик"))
+        self.db_manager.update_task(task_id, title="Публикация")
+
+        assert self.db_manager.search_tasks("Черновик") == []
+        assert [t.id for t in self.db_manager.search_tasks("Публикация")] == [task_id]
+
+        self.db_manager.delete_task(task_id)
+        assert self.db_manager.search_tasks("Публикация") == []
+
+    def test_search_falls_back_to_like(self):
+        """Тест поиска через LIKE при отсутствии FTS5"""
+        task_id = self.db_manager.add_task(self._make_task("Подстрока"))
+        self.db_manager._fts_enabled = False
+
+        assert [t.id for t in self.db_manager.search_tasks("строк")] == [task_id]
+
+    def test_keyset_pages_seek_through_index(self):
+        """Тест использования индекса при переходе к следующей странице"""
+        from database.pagination import keyset_query
+
+        query, params = keyset_query("tasks", "priority", (2, 100), 51)
+        plan = " ".join(self.db_manager.explain(query, params))
+        assert "idx_tasks_priority (priority=? AND rowid>?)" in plan
+        assert "SCAN tasks" not in plan
+
+    def test_overdue_query_uses_due_date_index(self):
+        """Тест использования индекса при поиске просроченных задач"""
+        plan = " ".join(self.db_manager.explain(
+            "SELECT COUNT(*) FROM tasks "
+            "WHERE due_date < ? AND (status IS NULL OR status != 'completed')",
+            (datetime.now().isoformat(),)
+        ))
+        assert "USING INDEX idx_tasks_due_date (due_date<?)" in plan
+
+    def test_entity_cache_read_through_and_invalidation(self):
+        """Тест кэша сущностей: попадания, промахи и инвалидация"""
+        self.db_manager.enable_cache(maxsize=2)
+        task_id = self.db_manager.add_task(self._make_task("Кэшируемая"))
+
+        first = self.db_manager.get_task_by_id(task_id)
+        assert self.db_manager.get_task_by_id(task_id) is first
+
+        self.db_manager.update_task(task_id, title="Обновленная")
+        assert self.db_manager.get_task_by_id(task_id).title == "Обновленная"
+
+        self.db_manager.delete_task(task_id)
+        assert self.db_manager.get_task_by_id(task_id) is None
+
+        assert self.db_manager.cache.tasks.stats() == {
+            "size": 0, "maxsize": 2, "hits": 1, "misses": 3, "evictions": 0
+        }
+
+    def test_entity_cache_evicts_least_recently_used(self):
+        """Тест вытеснения из LRU-кэша"""
+        self.db_manager.enable_cache(maxsize=2)
+        task_ids = [self.db_manager.add_task(self._make_task(f"Задача {i}")) for i in range(3)]
+        for task_id in task_ids:
+            self.db_manager.get_task_by_id(task_id)
+
+        stats = self.db_manager.cache.stats()["tasks"]
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+        self.db_manager.disable_cache()
+        first = self.db_manager.get_task_by_id(task_ids[0])
+        assert self.db_manager.get_task_by_id(task_ids[0]) is not first
+
+    def test_entity_cache_keeps_no_rolled_back_data(self):
+        """Тест отсутствия в кэше данных отмененной транзакции"""
+        self.db_manager.enable_cache()
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.update_user(self.user_id, username="renamed")
+                assert self.db_manager.get_user_by_id(self.user_id).username == "renamed"
+                raise RuntimeError("rollback")
+
+        assert self.db_manager.get_user_by_id(self.user_id).username == "test_user"
+
+    def test_entity_cache_inside_transaction(self):
+        """Тест кэша внутри транзакции: измененные строки читаются из базы"""
+        self.db_manager.enable_cache()
+        task_ids = [self.db_manager.add_task(self._make_task(f"Задача {i}")) for i in range(2)]
+        cached = self.db_manager.get_tasks_by_ids(task_ids)
+        with self.db_manager.transaction():
+            assert self.db_manager.get_task_by_id(task_ids[0]) is cached[task_ids[0]]
+            self.db_manager.update_task(task_ids[0], title="Новая")
+            assert self.db_manager.get_task_by_id(task_ids[0]).title == "Новая"
+            tasks = self.db_manager.get_tasks_by_ids(task_ids)
+            assert tasks[task_ids[0]].title == "Новая"
+            assert tasks[task_ids[1]] is cached[task_ids[1]]
+            new_id = self.db_manager.add_task(self._make_task("Добавленная"))
+            assert self.db_manager.get_task_by_id(new_id).title == "Добавленная"
+
+        assert len(self.db_manager.cache.tasks) == 1
+        assert self.db_manager.get_task_by_id(task_ids[0]).title == "Новая"
+
+    @pytest.mark.parametrize("write", [
+        lambda db, task_id: db.update_task(task_id, title="Новая"),
+        lambda db, task_id: db.update_tasks_where({"id": task_id}, title="Новая"),
+    ])
+    def test_entity_cache_invalidated_after_commit(self, write):
+        """Тест инвалидации кэша после фиксации транзакции другого потока"""
+        pooled = DatabaseManager(self.temp_db.name, pool_size=2, cache_size=16)
+        task_id = pooled.add_task(self._make_task("Старая"))
+        pooled.get_task_by_id(task_id)
+        written, read = threading.Event(), threading.Event()
+
+        def writer():
+            with pooled.transaction():
+                write(pooled, task_id)
+                written.set()
+                read.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            written.wait(5)
+            # До фиксации другой поток видит старую строку и может закэшировать ее
+            assert pooled.get_task_by_id(task_id).title == "Старая"
+            read.set()
+            thread.join()
+            assert pooled.get_task_by_id(task_id).title == "Новая"
+        finally:
+            read.set()
+            thread.join()
+            pooled.close()
+
+    def test_get_by_ids_chunks_and_uses_cache(self, monkeypatch):
+        """Тест пакетной загрузки: разбиение IN-списка и кэш"""
+        monkeypatch.setattr("database.database_manager.IN_CHUNK_SIZE", 2)
+        task_ids = [self.db_manager.add_task(self._make_task(f"Задача {i}")) for i in range(5)]
+        assert sorted(self.db_manager.get_tasks_by_ids(task_ids)) == task_ids
+
+        self.db_manager.enable_cache()
+        cached = self.db_manager.get_task_by_id(task_ids[0])
+        tasks = self.db_manager.get_tasks_by_ids(task_ids)
+        assert tasks[task_ids[0]] is cached
+        assert self.db_manager.cache.tasks.stats()["hits"] == 1
+        assert self.db_manager.get_tasks_by_ids(task_ids)[task_ids[4]] is tasks[task_ids[4]]
+
+        users = self.db_manager.get_users_by_ids([self.user_id])
+        assert users[self.user_id].username == "test_user"
+        projects = self.db_manager.get_projects_by_ids([self.project_id, 404])
+        assert list(projects) == [self.project_id]
+
+    def test_write_behind_groups_commits(self):
+        """Тест группового коммита через очередь отложенной записи"""
+        pooled = DatabaseManager(self.temp_db.name, pool_size=2)
+        task_ids = pooled.add_tasks_bulk([self._make_task(f"Задача {i}") for i in range(20)])
+        with WriteBehindQueue(pooled, max_batch=50, max_delay=0.05) as writer:
+            futures = [writer.update_task(task_id, priority=5) for task_id in task_ids]
+            failed = writer.update_task(task_ids[0], title=None)
+            added = writer.add_task(self._make_task("Новая"))
+            assert all(future.result(timeout=5) for future in futures)
+            with pytest.raises(sqlite3.IntegrityError):
+                failed.result(timeout=5)
+            assert pooled.get_task_by_id(added.result(timeout=5)).title == "Новая"
+            assert writer.batches < len(futures)
+        assert pooled.count_tasks(priority=5) == 20
+        with pytest.raises(RuntimeError):
+            writer.update_task(task_ids[0], priority=1)
+        pooled.close()
+
+    def test_write_behind_backpressure(self):
+        """Тест ограничения длины очереди отложенной записи"""
+        pooled = DatabaseManager(self.temp_db.name, pool_size=2)
+        gate = threading.Event()
+        with WriteBehindQueue(pooled, max_batch=1, max_queue=1, put_timeout=0.05) as writer:
+            writer.submit(gate.wait)
+            time.sleep(0.05)
+            writer.submit(lambda: None)
+            with pytest.raises(TimeoutError):
+                writer.submit(lambda: None)
+            gate.set()
+            writer.flush()
+        with pytest.raises(ValueError):
+            WriteBehindQueue(self.db_manager)
+        pooled.close()
+
+    def _submit_until_closed(self, writer, futures):
+        while True:
+            try:
+                futures.append(writer.submit(lambda: None))
+            except RuntimeError:
+                return
+
+    def test_write_behind_close_resolves_accepted_futures(self):
+        """Тест: закрытие очереди не оставляет принятые операции без результата"""
+        pooled = DatabaseManager(self.temp_db.name, pool_size=2)
+        writer = WriteBehindQueue(pooled, max_batch=10)
+        futures = []
+        submitters = [threading.Thread(target=self._submit_until_closed,
+                                       args=(writer, futures)) for _ in range(4)]
+        for thread in submitters:
+            thread.start()
+        time.sleep(0.05)
+        writer.close()
+        for thread in submitters:
+            thread.join()
+
+        assert futures
+        assert all(future.done() for future in futures)
+        pooled.close()
+
+    def test_instrumentation_records_queries(self, tmp_path):
+        """Тест сбора статистики запросов и журнала медленных запросов"""
+        slow_log = tmp_path / "slow.log"
+        self.db_manager.add_tasks_bulk([self._make_task(f"Задача {i}") for i in range(30)])
+        instrumentation = self.db_manager.enable_instrumentation(slow_ms=0, slow_log=str(slow_log))
+
+        self.db_manager.get_tasks_by_user(self.user_id)
+        self.db_manager.get_tasks_by_user(self.user_id)
+        self.db_manager.get_tasks_by_ids([1, 2, 3])
+        assert sum(1 for _ in self.db_manager.iter_tasks(chunk_size=7)) == 30
+
+        stats = {entry["method"]: entry for entry in self.db_manager.query_stats()}
+        by_user = stats["get_tasks_by_user"]
+        assert by_user["calls"] == 2
+        assert by_user["rows"] == 60
+        assert sum(by_user["histogram"].values()) == 2
+        assert any("idx_tasks_assignee_id" in step for step in by_user["plan"])
+        assert "IN (?, ...)" in stats["get_tasks_by_ids"]["statement"]
+        assert stats["iter_tasks"]["rows"] == 30
+
+        instrumentation.logger.handlers[-1].flush()
+        assert "get_tasks_by_user" in slow_log.read_text(encoding="utf-8")
+
+        self.db_manager.disable_instrumentation()
+        self.db_manager.get_all_tasks()
+        assert self.db_manager.query_stats() == []
+
+    def test_slow_query_logs_are_separate(self, tmp_path, capsys):
+        """Тест: у каждого менеджера свой журнал, без пути журнал не пишется"""
+        other = DatabaseManager(self.temp_db.name)
+        own = self.db_manager.enable_instrumentation(slow_ms=0, slow_log=str(tmp_path / "a.log"))
+        other.enable_instrumentation(slow_ms=0, slow_log=str(tmp_path / "b.log"))
+        self.db_manager.get_all_tasks()
+        own.logger.handlers[-1].flush()
+        other.disable_instrumentation()
+        assert "get_all_tasks" in (tmp_path / "a.log").read_text(encoding="utf-8")
+        assert "get_all_tasks" not in (tmp_path / "b.log").read_text(encoding="utf-8")
+
+        other.enable_instrumentation(slow_ms=0)
+        other.get_all_tasks()
+        assert other.query_stats()[0]["plan"]
+        assert capsys.readouterr().err == ""
+        other.close()
+
+    def test_export_import_round_trip_and_resume(self, tmp_path):
+        """Тест потокового экспорта и импорта с продолжением после ошибки"""
+        task_ids = self.db_manager.add_tasks_bulk(
+            [self._make_task(f"Задача {i}") for i in range(10)])
+        self.db_manager.update_task(task_ids[3], status="completed", assignee_id=None)
+        for fmt in ("csv", "jsonl"):
+            path = tmp_path / f"tasks.{fmt}"
+            assert export_table(self.db_manager, "tasks", str(path)) == 10
+
+            target = DatabaseManager(str(tmp_path / f"target_{fmt}.db"))
+            target.create_tables()
+            assert import_table(target, "tasks", str(path), chunk_size=4) == 10
+            assert [t.to_dict() for t in target.get_all_tasks()] == \
+                [t.to_dict() for t in self.db_manager.get_all_tasks()]
+            target.close()
+
+        lines = (tmp_path / "tasks.jsonl").read_text(encoding="utf-8").splitlines()
+        bad = json.loads(lines[6])
+        bad["status"] = "archived"
+        broken = tmp_path / "broken.jsonl"
+        broken.write_text("\n".join(lines[:6] + [json.dumps(bad)] + lines[7:]) + "\n",
+                          encoding="utf-8")
+
+        target = DatabaseManager(str(tmp_path / "resume.db"))
+        target.create_tables()
+        with pytest.raises(ValueError, match="record 7"):
+            import_table(target, "tasks", str(broken), chunk_size=4)
+        assert target.count_tasks() == 4
+
+        broken.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        assert import_table(target, "tasks", str(broken), chunk_size=4) == 6
+        assert target.count_tasks() == 10
+        assert target.get_import_checkpoint(os.path.abspath(broken), "tasks") == 0
+        target.close()
+
+    def test_export_import_keeps_nulls_and_stored_values(self, tmp_path):
+        """Тест: NULL, пустые строки и принятые приложением email переживают экспорт"""
+        self.db_manager.add_user(User("root", "admin@localhost", "admin"))
+        task = self._make_task("Без приоритета")
+        task.priority = None
+        task.description = ""
+        self.db_manager.add_task(task)
+        task = self._make_task("Без описания")
+        task.description = None
+        self.db_manager.add_task(task)
+        for fmt in ("csv", "jsonl"):
+            target = DatabaseManager(str(tmp_path / f"nulls_{fmt}.db"))
+            target.create_tables()
+            for kind, getter in (("users", "get_all_users"), ("tasks", "get_all_tasks")):
+                path = tmp_path / f"{kind}.{fmt}"
+                export_table(self.db_manager, kind, str(path))
+                import_table(target, kind, str(path))
+                assert [m.to_dict() for m in getattr(target, getter)()] == \
+                    [m.to_dict() for m in getattr(self.db_manager, getter)()]
+            target.close()
+
+    def test_import_reports_missing_title_with_record_number(self, tmp_path):
+        """Тест: задача без названия отклоняется с номером записи"""
+        path = tmp_path / "tasks.jsonl"
+        records = [{"title": "Задача", "priority": 1}, {"title": None, "priority": 1}]
+        path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+        with pytest.raises(ValueError, match="record 2"):
+            import_table(self.db_manager, "tasks", str(path))
+        assert self.db_manager.count_tasks() == 0
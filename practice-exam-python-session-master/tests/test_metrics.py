@@ -0,0 +1,79 @@
+import pytest
+import sys
+import os
+import tempfile
+import urllib.request
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from database.database_manager import DatabaseManager
+from controllers.task_controller import TaskController
+from controllers.metrics import (
+    MetricsFileWriter, MetricsRegistry, instrument_controller, register_database_gauges,
+    serve_metrics
+)
+
+
+class TestMetrics:
+    """Тесты для реестра метрик контроллеров"""
+
+    def setup_method(self):
+        """Настройка перед каждым тестом"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.temp_db.name, pool_size=2, cache_size=16)
+        self.db_manager.create_tables()
+        self.registry = MetricsRegistry()
+        self.controller = instrument_controller(TaskController(self.db_manager), self.registry)
+
+    def teardown_method(self):
+        self.db_manager.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def test_calls_errors_and_percentiles(self):
+        """Тест подсчета вызовов, ошибок и перцентилей"""
+        task_id = self.controller.add_task("Задача", "Описание", 1, None, None, None)
+        for _ in range(10):
+            self.controller.get_task(task_id)
+        with pytest.raises(ValueError):
+            self.controller.update_task_status(task_id, "archived")
+
+        snapshot = self.registry.snapshot()
+        assert snapshot[("TaskController", "get_task")]["calls"] == 10
+        assert snapshot[("TaskController", "update_task_status")]["errors"] == 1
+        get_task = snapshot[("TaskController", "get_task")]
+        assert 0 < get_task["p50"] <= get_task["p95"] <= get_task["p99"]
+
+    def test_prometheus_text_over_http_and_file(self, tmp_path):
+        """Тест вывода в формате Prometheus через HTTP и файл"""
+        register_database_gauges(self.registry, self.db_manager)
+        task_id = self.controller.add_task("Задача", "Описание", 1, None, None, None)
+        self.controller.get_task(task_id)
+
+        server = serve_metrics(self.registry, port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            text = urllib.request.urlopen(url, timeout=5).read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'controller_calls_total{controller="TaskController",method="add_task"} 1' in text
+        labels = 'controller="TaskController",method="get_task"'
+        assert f'controller_call_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f'controller_call_duration_quantile_seconds{{{labels},quantile="0.99"}}' in text
+        assert 'database_rows{table="tasks"} 1' in text
+        assert 'database_cache_entries{kind="tasks"} 1' in text
+
+        path = tmp_path / "metrics.prom"
+        writer = MetricsFileWriter(self.registry, str(path), interval=60)
+        writer.stop()
+        assert "# TYPE controller_calls_total counter" in path.read_text(encoding="utf-8")
+
+        memory_db = DatabaseManager(":memory:")
+        try:
+            with pytest.raises(ValueError):
+                register_database_gauges(self.registry, memory_db)
+        finally:
+            memory_db.close()
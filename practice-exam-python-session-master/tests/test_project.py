@@ -126,6 +126,15 @@ class TestProjectController:
         project = self.controller.get_project(project_id)
         assert project.status == "completed"
 
+    def test_update_project_status_uses_cache(self):
+        """Тест: смена статуса берет проект из кэша"""
+        self.db_manager.enable_cache()
+        project_id = self.controller.add_project("Проект", "Описание", None, None)
+        self.controller.get_project(project_id)
+        self.controller.update_project_status(project_id, "on_hold")
+        assert self.db_manager.cache.projects.stats()["hits"] == 1
+        assert self.controller.get_project(project_id).status == "on_hold"
+
     def test_get_project_progress(self):
         """Тест получения прогресса проекта"""
         project_id = self.controller.add_project(
@@ -152,3 +161,69 @@ class TestProjectController:
         assert isinstance(progress, float)
         assert 0 <= progress <= 100
 
+    def test_add_projects_bulk(self):
+        """Тест массового добавления проектов"""
+        projects = [
+            Project(f"Проект {i}", "Описание", datetime.now(), datetime.now() + timedelta(days=10))
+            for i in range(5)
+        ]
+        project_ids = self.controller.add_projects_bulk(projects)
+
+        assert len(project_ids) == 5
+        assert self.controller.get_project(project_ids[-1]).name == "Проект 4"
+
+    def test_project_progress_follows_task_changes(self):
+        """Тест счетчиков задач проекта при изменении задач"""
+        project_id = self.controller.add_project("Проект", "Описание", datetime.now(), None)
+        other_id = self.controller.add_project("Другой проект", "Описание", datetime.now(), None)
+        task_controller = TaskController(self.db_manager)
+        task_ids = [task_controller.add_task(f"Задача {i}", "Описание", 1, None, project_id, None)
+                    for i in range(4)]
+
+        task_controller.update_task_status(task_ids[0], "completed")
+        assert self.controller.get_project_progress(project_id) == 0.25
+
+        task_controller.update_task(task_ids[1], project_id=other_id)
+        task_controller.delete_task(task_ids[2])
+        assert self.db_manager.get_project_task_counts(project_id) == {
+            "total": 2, "pending": 1, "in_progress": 0, "completed": 1
+        }
+        assert self.controller.get_all_project_progress() == {project_id: 0.5, other_id: 0.0}
+
+    def test_rebuild_project_counters(self):
+        """Тест пересчета счетчиков задач проектов"""
+        import manage
+
+        project_id = self.controller.add_project("Проект", "Описание", datetime.now(), None)
+        task_controller = TaskController(self.db_manager)
+        task_id = task_controller.add_task("Задача", "Описание", 1, None, project_id, None)
+        task_controller.update_task_status(task_id, "completed")
+        self.db_manager._write("DELETE FROM project_task_counts")
+        assert self.controller.get_project_progress(project_id) == 0.0
+
+        manage.main(["--db", self.temp_db.name, "rebuild-counters"])
+        assert self.controller.get_project_progress(project_id) == 1.0
+
+    def test_status_counts_per_project(self):
+        """Тест подсчета задач по статусам для каждого проекта"""
+        task_controller = TaskController(self.db_manager)
+        first = self.controller.add_project("Первый", "Описание", datetime.now(), datetime.now())
+        second = self.controller.add_project("Второй", "Описание", datetime.now(), datetime.now())
+        for project_id, status in ((first, "pending"), (first, "completed"), (first, "completed"),
+                                   (second, "in_progress")):
+            task_id = task_controller.add_task("Задача", "Описание", 1, None, project_id, None)
+            task_controller.update_task_status(task_id, status)
+
+        assert self.controller.get_status_counts() == {
+            first: {"pending": 1, "completed": 2},
+            second: {"in_progress": 1},
+        }
+        assert task_controller.count_tasks_by("status", project_id=first) == {
+            "pending": 1, "completed": 2
+        }
+        assert task_controller.count_tasks(project_id=[first, second]) == 4
+        assert task_controller.exists_tasks(project_id=second, status="in_progress")
+        assert self.controller.count_projects() == 2
+        assert not self.controller.exists_projects(name="Третий")
+        with pytest.raises(ValueError):
+            task_controller.count_tasks_by("secret")
@@ -4,6 +4,7 @@ import os
 from datetime import datetime, timedelta
 import tempfile
 from database.database_manager import DatabaseManager
+from database.pagination import encode_cursor
 
 # Добавляем путь к модулям проекта
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -172,6 +173,18 @@ class TestTaskController:
         task = self.controller.get_task(task_id)
         assert task.status == "completed"
 
+    def test_update_task_status_uses_cache(self):
+        """Тест: смена статуса берет задачу из кэша"""
+        self.db_manager.enable_cache()
+        task_id = self.controller.add_task("Задача", "Описание", 1, None, self.project_id, None)
+        stats = self.db_manager.cache.tasks.stats
+        for status in ("in_progress", "completed"):
+            self.controller.get_task(task_id)
+            hits = stats()["hits"]
+            assert self.controller.update_task_status(task_id, status)
+            assert stats()["hits"] == hits + 1
+            assert self.controller.get_task(task_id).status == status
+
     def test_get_overdue_tasks(self):
         """Тест получения просроченных задач"""
         # Создаем просроченную задачу
@@ -228,6 +241,314 @@ class TestTaskController:
         for task in tasks:
             assert task.assignee_id == self.user_id
 
+    def test_add_tasks_bulk(self):
+        """Тест массового добавления задач"""
+        from models.task import Task
+
+        tasks = [
+            Task(f"Задача {i}", "Описание", 1, datetime.now() + timedelta(days=1),
+                 self.project_id, self.user_id)
+            for i in range(25)
+        ]
+        task_ids = self.db_manager.add_tasks_bulk(iter(tasks), chunk_size=10)
+
+        assert len(task_ids) == 25
+        assert task_ids == sorted(task_ids)
+        for i, task_id in enumerate(task_ids):
+            assert self.controller.get_task(task_id).title == f"Задача {i}"
+
+    def test_update_tasks_status_is_atomic(self):
+        """Тест группового обновления статуса в одной транзакции"""
+        task_ids = [
+            self.controller.add_task(f"Задача {i}", "Описание", 1,
+                                     datetime.now() + timedelta(days=1),
+                                     self.project_id, self.user_id)
+            for i in range(3)
+        ]
+
+        assert self.controller.update_tasks_status(task_ids, "in_progress") == 3
+
+        with pytest.raises(RuntimeError):
+            with self.db_manager.transaction():
+                self.controller.update_tasks_status(task_ids, "completed")
+                raise RuntimeError("rollback")
+        assert all(self.controller.get_task(t).status == "in_progress" for t in task_ids)
+
+    def test_iter_tasks_streams_rows(self):
+        """Тест потокового чтения задач"""
+        import types
+        import tracemalloc
+        from models.task import Task
+
+        self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "Описание " * 20, 1, None, self.project_id, self.user_id)
+            for i in range(5000)
+        )
+
+        tasks = self.controller.iter_tasks(chunk_size=100)
+        assert isinstance(tasks, types.GeneratorType)
+
+        tracemalloc.start()
+        count = sum(1 for _ in self.controller.iter_tasks(chunk_size=100))
+        streamed_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        all_tasks = self.controller.get_all_tasks()
+        list_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert count == len(all_tasks) == 5000
+        assert streamed_peak < list_peak / 4
+
+    def test_iter_tasks_by_project_and_search(self):
+        """Тест потоковых вариантов выборок"""
+        task_id = self.controller.add_task("Потоковая задача", "Описание", 1, None,
+                                           self.project_id, self.user_id)
+
+        assert [t.id for t in self.controller.iter_tasks_by_project(self.project_id)] == [task_id]
+        assert [t.id for t in self.controller.iter_tasks_by_user(self.user_id)] == [task_id]
+        assert [t.id for t in self.controller.iter_search_tasks("Потоковая")] == [task_id]
+
+    @pytest.mark.parametrize("order_by", ["id", "priority", "due_date"])
+    def test_get_tasks_page_walks_all_tasks(self, order_by):
+        """Тест постраничного обхода задач по ключу"""
+        from models.task import Task
+
+        base = datetime(2030, 1, 1)
+        self.db_manager.add_tasks_bulk(
+            Task(f"Задача {i}", "Описание", i % 3 + 1,
+                 None if i % 4 == 0 else base + timedelta(days=i % 5),
+                 self.project_id, self.user_id)
+            for i in range(23)
+        )
+
+        seen = []
+        page = self.controller.get_tasks_page(limit=5, order_by=order_by)
+        while True:
+            seen.extend(page.items)
+            if page.next_cursor is None:
+                break
+            page = self.controller.get_tasks_page(after=page.next_cursor, limit=5,
+                                                  order_by=order_by)
+
+        def sort_key(task):
+            value = getattr(task, order_by)
+            return (value is not None, value or 0, task.id) if order_by != "id" else task.id
+
+        expected = sorted(self.controller.get_all_tasks(), key=sort_key)
+        assert [t.id for t in seen] == [t.id for t in expected]
+
+    def test_get_tasks_page_rejects_foreign_cursor(self):
+        """Тест проверки курсора страницы"""
+        for i in range(3):
+            self.controller.add_task(f"Задача {i}", "Описание", 1, None,
+                                     self.project_id, self.user_id)
+        page = self.controller.get_tasks_page(limit=1, order_by="priority")
+
+        with pytest.raises(ValueError):
+            self.controller.get_tasks_page(after=page.next_cursor, order_by="id")
+        with pytest.raises(ValueError):
+            self.controller.get_tasks_page(after="not-a-cursor")
+        with pytest.raises(ValueError):
+            self.controller.get_tasks_page(after=42)
+        for value, row_id in (([1], 1), ({"a": 1}, 1), (1, "1"), (1, [1]), (1, True)):
+            forged = encode_cursor("priority", value, row_id)
+            with pytest.raises(ValueError, match="Invalid page cursor"):
+                self.controller.get_tasks_page(after=forged, order_by="priority")
+
+    def test_overdue_tasks_match_model_rule(self):
+        """Тест совпадения SQL-выборки просроченных задач с Task.is_overdue"""
+        now = datetime.now()
+        due_dates = [now - timedelta(days=2), now - timedelta(minutes=1),
+                     now + timedelta(days=1), None]
+        for i, due_date in enumerate(due_dates * 2):
+            task_id = self.controller.add_task(f"Задача {i}", "Описание", 1, due_date,
+                                               self.project_id, self.user_id)
+            if i >= len(due_dates):
+                self.controller.update_task_status(task_id, "completed")
+
+        expected = {t.id for t in self.controller.get_all_tasks() if t.is_overdue()}
+        overdue = self.controller.get_overdue_tasks()
+
+        assert {t.id for t in overdue} == expected
+        assert len(expected) == 2
+        assert self.controller.overdue_count() == 2
+        assert len(self.controller.get_overdue_tasks(limit=1)) == 1
+        assert self.controller.overdue_count(now=now - timedelta(days=1)) == 1
+
+    def test_models_use_slots(self):
+        """Тест компактных моделей без __dict__"""
+        task = self.controller.get_task(
+            self.controller.add_task("Задача", "Описание", 1, None, self.project_id, self.user_id)
+        )
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
+        assert task.to_dict()["title"] == "Задача"
+
+    def test_decoded_dates_parse_on_access(self):
+        """Тест ленивого разбора дат загруженных моделей"""
+        due = datetime(2030, 1, 2, 3, 4, 5)
+        task = self.controller.get_task(
+            self.controller.add_task("Задача", "Описание", 1, due, self.project_id, self.user_id)
+        )
+        assert task._due_date == due.isoformat()
+        assert task.due_date == due
+        assert task._due_date == due
+        task.due_date = None
+        assert task.to_dict()["due_date"] is None
+        user = self.db_manager.get_user_by_id(self.user_id)
+        assert isinstance(user.registration_date, datetime)
+
+    def test_task_batch_matches_tasks(self):
+        """Тест колоночного контейнера задач"""
+        now = datetime.now()
+        due_dates = [now - timedelta(days=1), now + timedelta(days=1), None,
+                     now - timedelta(hours=1)]
+        # Приоритет не ограничен схемой, в том числе сверх 16 бит
+        priorities = [1, 2, 40000, 2 ** 40]
+        for i, (due_date, priority) in enumerate(zip(due_dates, priorities)):
+            task_id = self.controller.add_task(f"Задача {i}", "Описание", priority, due_date,
+                                               self.project_id, self.user_id if i % 2 else None)
+        self.controller.update_task_status(task_id, "completed")
+
+        batch = self.controller.get_task_batch()
+        tasks = self.controller.get_all_tasks()
+
+        assert list(batch.ids) == [t.id for t in tasks]
+        assert list(batch.priorities) == [t.priority for t in tasks]
+        assert [batch.status(i) for i in range(len(batch))] == [t.status for t in tasks]
+        assert list(batch.assignee_ids) == [t.assignee_id or 0 for t in tasks]
+        assert batch.due_date(2) is None
+        assert abs((batch.due_date(0) - tasks[0].due_date).total_seconds()) < 0.01
+        assert batch.count_by_status() == {"pending": 3, "completed": 1}
+        assert batch.overdue_ids(now) == [t.id for t in tasks if t.is_overdue()]
+
+        chunks = list(self.db_manager.iter_task_batches(chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+
+    def test_get_tasks_projects_columns(self):
+        """Тест выборки только нужных колонок"""
+        first = self.controller.add_task("Первая", "Описание", 1, None,
+                                         self.project_id, self.user_id)
+        second = self.controller.add_task("Вторая", "Описание", 2, None, self.project_id, None)
+        self.controller.update_task_status(second, "completed")
+
+        rows = self.controller.get_tasks(fields=("id", "title", "status"))
+        assert rows == [(first, "Первая", "pending"), (second, "Вторая", "completed")]
+        assert rows[0]._fields == ("id", "title", "status")
+        assert rows[1].title == "Вторая"
+
+        assigned = self.controller.get_tasks(fields=("id",), assignee_id=self.user_id)
+        unassigned = self.controller.get_tasks(fields=("id",), assignee_id=None)
+        assert [r.id for r in assigned] == [first]
+        assert [r.id for r in unassigned] == [second]
+        assert len(self.controller.get_tasks(status=["pending", "completed"])) == 2
+        assert self.controller.get_tasks(fields=("id",), status=[]) == []
+
+        with pytest.raises(ValueError):
+            self.controller.get_tasks(fields=("id", "secret"))
+        with pytest.raises(ValueError):
+            self.controller.get_tasks(owner=1)
+
+    def test_get_tasks_parse_dates(self):
+        """Тест выборки колонок с разбором дат"""
+        due = datetime(2030, 1, 2, 3, 4)
+        task_id = self.controller.add_task("Задача", "Описание", 1, due, self.project_id, None)
+        self.controller.add_task("Без срока", "Описание", 1, None, self.project_id, None)
+
+        fields = ("id", "due_date")
+        assert self.controller.get_tasks(fields=fields)[0] == (task_id, due.isoformat())
+        rows = self.controller.get_tasks(fields=fields, parse_dates=True)
+        assert [row.due_date for row in rows] == [due, None]
+        assert rows[0]._fields == fields
+        assert self.controller.get_tasks(fields=("id",), parse_dates=True) == \
+            [(row.id,) for row in rows]
+
+    def test_get_tasks_by_ids_and_details(self):
+        """Тест пакетной загрузки по id и задач со связанными сущностями"""
+        assigned = self.controller.add_task("Назначенная", "Описание", 1, None,
+                                            self.project_id, self.user_id)
+        orphan = self.controller.add_task("Без связей", "Описание", 2, None, None, None)
+
+        tasks = self.controller.get_tasks_by_ids([orphan, assigned, orphan, 999])
+        assert set(tasks) == {assigned, orphan}
+        assert tasks[assigned].title == "Назначенная"
+
+        details = self.controller.get_tasks_with_details()
+        assert [d.task.id for d in details] == [assigned, orphan]
+        assert details[0].assignee.username == "test_user"
+        assert details[0].project.name == "Тестовый проект"
+        assert details[1].assignee is None and details[1].project is None
+
+        only_assigned = self.controller.get_tasks_with_details(assignee_id=self.user_id)
+        assert [d.task.id for d in only_assigned] == [assigned]
+
+    def test_bulk_update_reassign_and_delete(self):
+        """Тест массовых операций по условию"""
+        other_user = self.db_manager.add_user(User("other", "other@example.com", "developer"))
+        task_ids = [
+            self.controller.add_task(f"Задача {i}", "Описание", 1, None,
+                                     self.project_id, self.user_id)
+            for i in range(3)
+        ]
+        self.controller.add_task("Чужая", "Описание", 1, None, None, other_user)
+
+        assert self.controller.bulk_update_status({"project_id": self.project_id}, "completed") == 3
+        assert self.db_manager.get_project_progress(self.project_id) == 1.0
+        assert self.controller.get_task(task_ids[0]).status == "completed"
+
+        assert self.controller.reassign_tasks(self.user_id, other_user) == 3
+        assert self.controller.get_tasks_by_user(self.user_id) == []
+
+        assert self.controller.delete_tasks_where(id=task_ids[:2]) == 2
+        assert len(self.controller.get_all_tasks()) == 2
+
+        with pytest.raises(ValueError):
+            self.controller.bulk_update_status({"project_id": self.project_id}, "archived")
+        with pytest.raises(ValueError):
+            self.controller.bulk_update_status({}, "pending")
+        with pytest.raises(ValueError):
+            self.controller.delete_tasks_where()
+        with pytest.raises(ValueError):
+            self.db_manager.update_tasks_where({"id": task_ids[2]}, id=1)
+
+    def test_task_query_combines_filters(self):
+        """Тест построителя запросов задач"""
+        now = datetime(2026, 1, 10)
+        ids = [
+            self.controller.add_task(f"Задача {i}", "Описание", priority, now + timedelta(days=i),
+                                     self.project_id, self.user_id if i % 2 else None)
+            for i, priority in enumerate([1, 3, 2, 3, 5])
+        ]
+        self.controller.update_task_status(ids[3], "in_progress")
+
+        query = (self.controller.query()
+                 .status("pending", "in_progress")
+                 .priority_between(2, 4)
+                 .due_between(now, now + timedelta(days=4))
+                 .assigned_to(self.user_id)
+                 .order_by("priority", descending=True))
+        assert [t.id for t in query.all()] == [ids[3], ids[1]]
+        assert [t.id for t in query.limit(1).all()] == [ids[3]]
+
+        tasks = self.controller.get_all_tasks()
+        expected = [t.id for t in tasks if t.project_id == self.project_id]
+        in_project = self.controller.query().in_projects(self.project_id).all()
+        assert [t.id for t in in_project] == expected
+        assert self.controller.query().in_projects().all() == []
+
+        same_shape = self.controller.query().assigned_to(42).status("completed")
+        other_order = self.controller.query().status("pending").assigned_to(self.user_id)
+        assert same_shape.to_sql()[0] == other_order.to_sql()[0]
+
+        plan = " ".join(self.controller.query().assigned_to(self.user_id).explain())
+        assert "idx_tasks_assignee_id" in plan
+
+        with pytest.raises(ValueError):
+            self.controller.query().status("archived")
+        with pytest.raises(ValueError):
+            self.controller.query().order_by("title")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -128,3 +128,39 @@ class TestUserController:
 
         for task in tasks:
             assert task.assignee_id == user_id
+
+    def test_add_users_bulk(self):
+        """Тест массового добавления пользователей"""
+        users = [User(f"user{i}", f"user{i}@example.com", "developer") for i in range(5)]
+        user_ids = self.controller.add_users_bulk(users)
+
+        assert len(user_ids) == 5
+        assert [self.controller.get_user(uid).username for uid in user_ids] == \
+            [u.username for u in users]
+
+    def test_get_users_page(self):
+        """Тест постраничного получения пользователей"""
+        for name in ("carol", "alice", "bob"):
+            self.controller.add_user(name, f"{name}@example.com", "developer")
+
+        first = self.controller.get_users_page(limit=2, order_by="username")
+        second = self.controller.get_users_page(after=first.next_cursor, limit=2,
+                                                order_by="username")
+
+        assert [u.username for u in first.items] == ["alice", "bob"]
+        assert [u.username for u in second.items] == ["carol"]
+        assert second.next_cursor is None
+
+    def test_count_and_exists_users(self):
+        """Тест подсчета пользователей и их задач без загрузки строк"""
+        user_id = self.controller.add_user("counted", "counted@example.com", "manager")
+        task_controller = TaskController(self.db_manager)
+        for status in ("pending", "pending", "completed"):
+            task_id = task_controller.add_task("Задача", "Описание", 1, None, None, user_id)
+            task_controller.update_task_status(task_id, status)
+
+        assert self.controller.count_users(role="manager") == 1
+        assert self.controller.exists_users(email="counted@example.com")
+        assert not self.controller.exists_users(email="missing@example.com")
+        assert self.controller.count_user_tasks(user_id) == 3
+        assert self.controller.count_user_tasks(user_id, "pending") == 2
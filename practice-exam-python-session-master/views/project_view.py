@@ -67,9 +67,9 @@ class ProjectView(ttk.Frame):
     def refresh_projects(self) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-        projects = self.controller.get_all_projects()
-        for p in projects:
-            self.tree.insert("", "end", values=(p.id, p.name, p.status, p.start_date, p.end_date))
+        fields = ("id", "name", "status", "start_date", "end_date")
+        for row in self.controller.get_projects(fields=fields, parse_dates=True):
+            self.tree.insert("", "end", values=row)
 
     def show_project_tasks(self) -> None:
         selected = self.tree.selection()
@@ -79,19 +79,19 @@ class ProjectView(ttk.Frame):
         item = selected[0]
         project_id = self.tree.item(item)['values'][0]
         
-        tasks = self.task_controller.get_tasks_by_project(project_id)
+        columns = ("id", "title", "status")
+        tasks = self.task_controller.get_tasks(fields=columns, project_id=project_id)
         
         popup = tk.Toplevel(self)
         popup.title(f"Tasks for Project {project_id}")
         
-        columns = ("id", "title", "status")
         tree = ttk.Treeview(popup, columns=columns, show="headings")
         for col in columns:
             tree.heading(col, text=col.capitalize())
         tree.pack(fill="both", expand=True)
         
-        for t in tasks:
-            tree.insert("", "end", values=(t.id, t.title, t.status))
+        for row in tasks:
+            tree.insert("", "end", values=row)
 
     def show_progress(self) -> None:
         selected = self.tree.selection()
@@ -83,9 +83,9 @@ class TaskView(ttk.Frame):
     def refresh_tasks(self) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-        tasks = self.controller.get_all_tasks()
-        for t in tasks:
-            self.tree.insert("", "end", values=(t.id, t.title, t.priority, t.status, t.due_date, t.project_id, t.assignee_id))
+        fields = ("id", "title", "priority", "status", "due_date", "project_id", "assignee_id")
+        for row in self.controller.get_tasks(fields=fields, parse_dates=True):
+            self.tree.insert("", "end", values=row)
 
     def search_tasks(self) -> None:
         query = self.search_entry.get()
@@ -58,9 +58,9 @@ class UserView(ttk.Frame):
     def refresh_users(self) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-        users = self.controller.get_all_users()
-        for u in users:
-            self.tree.insert("", "end", values=(u.id, u.username, u.email, u.role, u.registration_date))
+        fields = ("id", "username", "email", "role", "registration_date")
+        for row in self.controller.get_users(fields=fields, parse_dates=True):
+            self.tree.insert("", "end", values=row)
 
     def show_user_tasks(self) -> None:
         selected = self.tree.selection()
@@ -70,8 +70,9 @@ class UserView(ttk.Frame):
         item = selected[0]
         user_id = self.tree.item(item)['values'][0]
         
+        columns = ("id", "title", "status")
         try:
-            tasks = self.task_controller.get_tasks_by_user(user_id)
+            tasks = self.task_controller.get_tasks(fields=columns, assignee_id=user_id)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to get tasks: {e}")
             return
@@ -79,14 +80,13 @@ class UserView(ttk.Frame):
         popup = tk.Toplevel(self)
         popup.title(f"Tasks for User {user_id}")
         
-        columns = ("id", "title", "status")
         tree = ttk.Treeview(popup, columns=columns, show="headings")
         for col in columns:
             tree.heading(col, text=col.capitalize())
         tree.pack(fill="both", expand=True)
         
-        for t in tasks:
-            tree.insert("", "end", values=(t.id, t.title, t.status))
+        for row in tasks:
+            tree.insert("", "end", values=row)
 
     def delete_selected(self) -> None:
         pass
\ No newline at end of file